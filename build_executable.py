@@ -6,12 +6,14 @@ This script creates a Windows .exe file that can be double-clicked to run.
 The executable includes all dependencies and can run on any Windows machine.
 """
 
+import hashlib
 import os
+import re
 import sys
-import subprocess
-import shutil
 from pathlib import Path
-import time
+
+SPEC_FILE = "excel_processor.spec"
+DIST_DIR = "dist"
 
 def print_banner():
     """Print a nice banner."""
@@ -20,24 +22,37 @@ def print_banner():
     print("=" * 70)
     print()
 
-def check_requirements():
+def check_requirements(log=print):
     """Check if PyInstaller is installed."""
+    import importlib.metadata
+    import subprocess
+    
     try:
-        import PyInstaller
-        print("✅ PyInstaller is installed")
+        # Metadata lookup only - avoids importing PyInstaller just to test presence
+        importlib.metadata.version("pyinstaller")
+        log("✅ PyInstaller is installed")
         return True
-    except ImportError:
-        print("❌ PyInstaller not found!")
-        print("Installing PyInstaller...")
+    except importlib.metadata.PackageNotFoundError:
+        log("❌ PyInstaller not found!")
+        log("Installing PyInstaller...")
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-            print("✅ PyInstaller installed successfully")
+            # Captured so pip's output doesn't interleave with the other preparation steps
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install",
+                 "--disable-pip-version-check", "--no-input", "pyinstaller"],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            log("✅ PyInstaller installed successfully")
             return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install PyInstaller")
+        except subprocess.CalledProcessError as e:
+            log("❌ Failed to install PyInstaller")
+            if e.stderr:
+                log(e.stderr.rstrip())
             return False
 
-def create_version_info():
+def create_version_info(log=print):
     """Create version info file for Windows executable."""
     version_content = '''# UTF-8
 #
@@ -73,9 +88,40 @@ VSVersionInfo(
   ]
 )'''
     
-    with open('version_info.txt', 'w', encoding='utf-8') as f:
-        f.write(version_content)
-    print("✅ Created version info file")
+    # Skip the write when the content is unchanged so PyInstaller's cache stays valid
+    if _file_digest('version_info.txt') == hashlib.blake2b(version_content.encode('utf-8')).hexdigest():
+        log("✅ Version info file is up to date")
+        return
+    
+    # Write to a temp file and rename so a crash never leaves a truncated file
+    import tempfile
+    with tempfile.NamedTemporaryFile('w', delete=False, dir='.', encoding='utf-8',
+                                     prefix='version_info.', suffix='.tmp') as tf:
+        tf.write(version_content)
+        tmp_name = tf.name
+    os.replace(tmp_name, 'version_info.txt')
+    log("✅ Created version info file")
+
+def _file_digest(path):
+    """Return the blake2b hex digest of a file's contents, or None if missing."""
+    try:
+        # Text mode so platform newline translation doesn't affect the digest
+        with open(path, 'r', encoding='utf-8') as f:
+            return hashlib.blake2b(f.read().encode('utf-8')).hexdigest()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def _run_step(step, *args):
+    """Run one preparation step with its messages buffered.
+    
+    Returns (result, messages, error) so the caller can print each step's
+    output in one block instead of interleaving concurrent steps.
+    """
+    messages = []
+    try:
+        return step(*args, log=messages.append), messages, None
+    except Exception as e:
+        return None, messages, e
 
 def create_simple_icon():
     """Create a simple icon file if none exists."""
@@ -84,99 +130,205 @@ def create_simple_icon():
         print("ℹ️  No icon file found, executable will use default icon")
         print("   You can add 'app_icon.ico' for a custom icon")
 
-def clean_build_dirs():
-    """Clean previous build directories."""
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_clean:
+def _scandir_rmtree(path):
+    """Recursively delete a directory tree using cached os.scandir entry types."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def _python_rmtree(dir_name):
+    """Python fallback when the native delete command is unavailable."""
+    import shutil
+    try:
+        _scandir_rmtree(dir_name)
+    except OSError:
+        shutil.rmtree(dir_name, ignore_errors=True)
+
+def _native_rmtree(dir_name, log=print):
+    """Delete a directory tree with the OS's bulk-delete command."""
+    import subprocess
+    try:
+        if os.name == 'nt':
+            completed = subprocess.run(
+                ["cmd", "/c", "rd", "/s", "/q", dir_name],
+                check=False,
+                capture_output=True,
+                text=True,
+                creationflags=subprocess.CREATE_NO_WINDOW
+            )
+        else:
+            completed = subprocess.run(["rm", "-rf", dir_name], check=False, capture_output=True, text=True)
+    except (FileNotFoundError, OSError):
+        # Delete binary not available, use the Python fallback
+        _python_rmtree(dir_name)
+        return
+    
+    # The caller retries in Python if anything is left; say why the native delete failed
+    if completed.returncode != 0:
+        detail = completed.stderr.strip() or "no error output"
+        log(f"⚠️  Native delete of {dir_name} failed (exit code {completed.returncode}): {detail}")
+
+def _clean_dir(dir_name, log=print):
+    """Remove a single build directory if it exists."""
+    if os.path.exists(dir_name):
+        _native_rmtree(dir_name, log)
+        if os.path.exists(dir_name):
+            _python_rmtree(dir_name)
+        # The fallback ignores errors, so check - e.g. a running exe locks dist/ on Windows
         if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
-            print(f"🧹 Cleaned {dir_name}")
+            raise OSError(f"Could not remove {dir_name} - close any program using files in it and retry")
+        log(f"🧹 Cleaned {dir_name}")
 
-def build_executable():
-    """Build the Windows executable."""
+def clean_build_dirs(clean=True, log=print):
+    """Clean previous build directories.
+    
+    With clean=False the build/ directory is kept so PyInstaller can reuse
+    its analysis cache.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    dirs_to_clean = ['build', 'dist', '__pycache__'] if clean else ['dist', '__pycache__']
+    # Each directory is independent, so delete them concurrently
+    with ThreadPoolExecutor(max_workers=len(dirs_to_clean)) as executor:
+        list(executor.map(lambda dir_name: _clean_dir(dir_name, log), dirs_to_clean))
+
+def build_executable(clean=False):
+    """Build the Windows executable.
+    
+    Incremental by default: PyInstaller reuses its analysis cache in build/.
+    Pass clean=True for a full rebuild.
+    """
     print("\n🔨 Building Windows executable...")
     print("This may take several minutes...")
     
+    pyi_args = []
+    if clean:
+        pyi_args.append("--clean")  # Clean cache
+    pyi_args.append(SPEC_FILE)
+    
     try:
-        # Run PyInstaller with the spec file
-        cmd = [
-            sys.executable, "-m", "PyInstaller",
-            "--clean",  # Clean cache
-            "excel_processor.spec"
-        ]
+        # Run PyInstaller in-process: no second interpreter start-up and
+        # its log output goes straight to our console as it is produced
+        from PyInstaller.__main__ import run as pyi_run
+    except ImportError:
+        return _build_executable_subprocess(pyi_args)
+    
+    try:
+        pyi_run(pyi_args)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"❌ Build failed! See the PyInstaller output above. (exit code {e.code})")
+            return False
+    except Exception as e:
+        print(f"❌ Build error: {e}")
+        return False
+    
+    print("✅ Build completed successfully!")
+    return True
+
+def _build_executable_subprocess(pyi_args):
+    """Fallback: run PyInstaller as a subprocess and stream its output."""
+    import subprocess
+    
+    try:
+        cmd = [sys.executable, "-m", "PyInstaller", *pyi_args]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Stream PyInstaller's output live instead of buffering the whole log
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        for line in process.stdout:
+            print(line, end="")
         
-        if result.returncode == 0:
+        if process.wait() == 0:
             print("✅ Build completed successfully!")
             return True
         else:
-            print("❌ Build failed!")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
+            print("❌ Build failed! See the PyInstaller output above.")
             return False
             
     except Exception as e:
         print(f"❌ Build error: {e}")
         return False
 
+def get_build_output_path(spec_file=SPEC_FILE):
+    """Work out where PyInstaller writes the executable from the spec file."""
+    name = "ExcelProductExtractor"
+    try:
+        with open(spec_file, 'r', encoding='utf-8') as f:
+            spec_content = f.read()
+        match = re.search(r"^APP_NAME\s*=\s*['\"]([^'\"]+)['\"]", spec_content, re.MULTILINE)
+        if match:
+            name = match.group(1)
+    except OSError:
+        pass
+    
+    # Onedir build: dist/<name>/<name>(.exe)
+    exe_name = f"{name}.exe" if sys.platform == "win32" else name
+    return Path(DIST_DIR) / name / exe_name
+
 def check_executable():
     """Check if the executable was created and provide usage instructions."""
-    # Check for single file executable (macOS/Linux builds don't use .exe)
-    exe_paths = [
-        Path("dist/ExcelProductExtractor.exe"),  # Windows
-        Path("dist/ExcelProductExtractor"),      # macOS/Linux
-        Path("dist/ExcelProductExtractor_dist/ExcelProductExtractor.exe"),  # Windows directory dist
-        Path("dist/ExcelProductExtractor_dist/ExcelProductExtractor"),      # macOS/Linux directory dist
-    ]
+    exe_path = get_build_output_path()
     
+    # The output location is known from the spec, so only stat that one path
     found_exe = None
-    for exe_path in exe_paths:
-        if exe_path.exists():
-            found_exe = exe_path
-            break
+    try:
+        exe_stat = exe_path.stat()
+        found_exe = exe_path
+    except OSError:
+        pass
     
     if found_exe:
-        size_mb = found_exe.stat().st_size / (1024 * 1024)
+        size_mb = exe_stat.st_size / (1024 * 1024)
         print(f"\n🎉 SUCCESS! Executable created:")
         print(f"📁 Location: {found_exe.absolute()}")
         print(f"📏 Size: {size_mb:.1f} MB")
         
         if found_exe.name.endswith('.exe'):
             print("\n📋 How to use:")
-            print("1. Copy the .exe file to any Windows computer")
-            print("2. Double-click the .exe file to run the application")
+            print(f"1. Copy the whole '{found_exe.parent.name}' folder to any Windows computer")
+            print("2. Double-click the .exe file inside it to run the application")
             print("3. No Python installation required on target machine!")
         else:
             print("\n📋 How to use:")
-            print("1. Copy this executable to any compatible computer")
-            print("2. Double-click or run from terminal to start the application")
+            print(f"1. Copy the whole '{found_exe.parent.name}' folder to any compatible computer")
+            print("2. Double-click or run the executable inside it from terminal")
             print("3. No Python installation required on target machine!")
         
         print("\n💡 Tips:")
-        print("- The executable includes all dependencies")
-        print("- First launch may take a few seconds to extract files")
-        print("- You can rename the executable if desired")
-        print("- Create a desktop shortcut for easy access")
-        
-        # If directory distribution exists, mention it
-        dir_dist = Path("dist/ExcelProductExtractor_dist")
-        if dir_dist.exists():
-            print(f"\n📦 Directory distribution also available at:")
-            print(f"   {dir_dist.absolute()}")
-            print("   This contains the executable plus all dependencies as separate files")
+        print("- The folder contains the executable plus all dependencies as separate files")
+        print("- Keep the executable next to its files; launch is instant (nothing to extract)")
+        print("- Create a desktop shortcut to the executable for easy access")
         
         return True
     else:
         print("\n❌ Executable not found! Build may have failed.")
-        print("Checked locations:")
-        for path in exe_paths:
-            print(f"  - {path}")
+        print(f"Checked location: {exe_path}")
         print("Check the error messages above.")
         return False
 
-def main():
+def main(argv=None):
     """Main build process."""
+    import argparse
+    import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    parser = argparse.ArgumentParser(description="Build the Excel Product Extractor executable")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="full rebuild: wipe build/ and PyInstaller's analysis cache"
+    )
+    args = parser.parse_args(argv)
+    
     print_banner()
     
     # Change to script directory
@@ -184,21 +336,36 @@ def main():
     os.chdir(script_dir)
     print(f"📁 Working directory: {os.getcwd()}")
     
-    # Check requirements
-    if not check_requirements():
+    # Check requirements, create necessary files and clean previous builds.
+    # These steps are independent, so overlap pip's network I/O with disk I/O.
+    print("\n🧹 Checking requirements and cleaning previous builds...")
+    prep_failed = False
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        requirements_future = executor.submit(_run_step, check_requirements)
+        prep_futures = [
+            requirements_future,
+            executor.submit(_run_step, create_version_info),
+            executor.submit(_run_step, clean_build_dirs, args.full),
+        ]
+        
+        # Each step's output is printed as one block as soon as that step finishes,
+        # so a failure is reported right away rather than after pip is done
+        for future in as_completed(prep_futures):
+            _, messages, error = future.result()
+            for message in messages:
+                print(message)
+            if error is not None:
+                print(f"❌ Build preparation failed: {error}")
+                prep_failed = True
+    
+    if prep_failed or not requirements_future.result()[0]:
         return False
     
-    # Create necessary files
-    create_version_info()
     create_simple_icon()
     
-    # Clean previous builds
-    print("\n🧹 Cleaning previous builds...")
-    clean_build_dirs()
-    
     # Build the executable
     start_time = time.time()
-    success = build_executable()
+    success = build_executable(clean=args.full)
     build_time = time.time() - start_time
     
     if success:
@@ -211,6 +378,8 @@ def main():
         print("2. Check that you're in the correct directory")
         print("3. Try running: python start_app.py (to test the app works)")
         print("4. Check Python version (should be 3.8+)")
+        if not args.full:
+            print("5. Try a full rebuild: python build_executable.py --full")
     
     return success
 
@@ -7,53 +7,96 @@ Verifies all required files are present and properly configured.
 import os
 import sys
 from pathlib import Path
+try:
+    from dulwich import porcelain
+    DULWICH_AVAILABLE = True
+except ImportError:
+    DULWICH_AVAILABLE = False
 
-def check_file(filepath, description):
-    """Check if a file exists and print status."""
-    if Path(filepath).exists():
-        print(f"✅ {description}: {filepath}")
-        return True
+# Encode once per buffer flush rather than once per print (matters on Windows consoles)
+if hasattr(sys.stdout, "reconfigure"):
+    sys.stdout.reconfigure(encoding="utf-8", write_through=False)
+
+REQUIRED_DESCRIPTIONS = {
+    "requirements.txt": "Python dependencies",
+    "excel_processor.spec": "PyInstaller configuration",
+    "start_app.py": "Application entry point",
+    "main_modern.py": "Main application file",
+    ".github/workflows/build-executables.yml": "GitHub Actions workflow",
+    "src/gui/modern_window.py": "GUI module",
+    "src/utils/config.py": "Configuration module",
+    "config/settings.yaml": "Application settings",
+}
+REQUIRED = frozenset(REQUIRED_DESCRIPTIONS)
+
+def _list_directory(dirname, listing_cache):
+    """Return the entry names of a directory, scanning it only once."""
+    if dirname not in listing_cache:
+        try:
+            with os.scandir(dirname or ".") as entries:
+                listing_cache[dirname] = {entry.name for entry in entries}
+        except OSError:
+            listing_cache[dirname] = set()
+    return listing_cache[dirname]
+
+def _status_line(filepath, description, present):
+    """Format the report line for a required file."""
+    if present:
+        return f"✅ {description}: {filepath}"
+    return f"❌ {description}: {filepath} (MISSING)"
+
+def check_file(filepath, description, listing_cache=None, output=None):
+    """Check if a file exists and print (or collect) its status line."""
+    if listing_cache is None:
+        listing_cache = {}
+    dirname, basename = os.path.split(filepath)
+    present = basename in _list_directory(dirname, listing_cache)
+    line = _status_line(filepath, description, present)
+    
+    if output is None:
+        print(line)
     else:
-        print(f"❌ {description}: {filepath} (MISSING)")
-        return False
+        output.append(line)
+    return present
 
 def check_github_setup():
     """Check if all required files are present for GitHub Actions."""
-    print("🔍 Checking GitHub Actions Setup")
-    print("=" * 50)
+    # Collect the report and write it in one go instead of one print per line
+    lines = ["🔍 Checking GitHub Actions Setup", "=" * 50]
     
-    required_files = [
-        ("requirements.txt", "Python dependencies"),
-        ("excel_processor.spec", "PyInstaller configuration"),
-        ("start_app.py", "Application entry point"),
-        ("main_modern.py", "Main application file"),
-        (".github/workflows/build-executables.yml", "GitHub Actions workflow"),
-        ("src/gui/modern_window.py", "GUI module"),
-        ("src/utils/config.py", "Configuration module"),
-        ("config/settings.yaml", "Application settings"),
-    ]
+    # One scandir per directory, then a single set difference for what's missing
+    listing_cache = {}
+    found = {
+        filepath for filepath in REQUIRED
+        if os.path.basename(filepath) in _list_directory(os.path.dirname(filepath), listing_cache)
+    }
+    missing = REQUIRED - found
+    all_present = not missing
     
-    all_present = True
-    for filepath, description in required_files:
-        if not check_file(filepath, description):
-            all_present = False
+    for filepath, description in REQUIRED_DESCRIPTIONS.items():
+        lines.append(_status_line(filepath, description, filepath not in missing))
     
-    print("\n" + "=" * 50)
+    lines.append("\n" + "=" * 50)
     
     if all_present:
-        print("🎉 All required files are present!")
-        print("\n📋 Next steps:")
-        print("1. Make sure all files are committed to git")
-        print("2. Push to GitHub: git push origin main")
-        print("3. Check GitHub Actions tab for build status")
-        return True
+        lines.extend([
+            "🎉 All required files are present!",
+            "\n📋 Next steps:",
+            "1. Make sure all files are committed to git",
+            "2. Push to GitHub: git push origin main",
+            "3. Check GitHub Actions tab for build status",
+        ])
     else:
-        print("⚠️  Some required files are missing!")
-        print("\n🔧 To fix this:")
-        print("1. Make sure you're in the correct directory")
-        print("2. Create any missing files")
-        print("3. Commit and push to GitHub")
-        return False
+        lines.extend([
+            "⚠️  Some required files are missing!",
+            "\n🔧 To fix this:",
+            "1. Make sure you're in the correct directory",
+            "2. Create any missing files",
+            "3. Commit and push to GitHub",
+        ])
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    return all_present
 
 def check_git_status():
     """Check git status and suggest next steps."""
@@ -66,25 +109,46 @@ def check_git_status():
         return False
     
     # Check if there are uncommitted changes
-    import subprocess
     try:
-        result = subprocess.run(['git', 'status', '--porcelain'], 
-                              capture_output=True, text=True)
-        if result.stdout.strip():
-            print("📝 Uncommitted changes found:")
-            print(result.stdout)
-            print("\n💡 Commit with:")
-            print("   git add .")
-            print("   git commit -m 'Fix GitHub Actions setup'")
-            print("   git push origin main")
-        else:
-            print("✅ All changes committed!")
-            print("\n📤 Push to GitHub:")
-            print("   git push origin main")
-        return True
+        changes = _get_uncommitted_changes()
     except FileNotFoundError:
         print("❌ Git not found in PATH")
         return False
+    
+    if changes:
+        print("📝 Uncommitted changes found:")
+        print(changes)
+        print("\n💡 Commit with:")
+        print("   git add .")
+        print("   git commit -m 'Fix GitHub Actions setup'")
+        print("   git push origin main")
+    else:
+        print("✅ All changes committed!")
+        print("\n📤 Push to GitHub:")
+        print("   git push origin main")
+    return True
+
+def _get_uncommitted_changes():
+    """Return a porcelain-style summary of uncommitted changes ('' if clean)."""
+    if DULWICH_AVAILABLE:
+        # Read .git/index directly instead of spawning a git process
+        status = porcelain.status(".")
+        lines = []
+        for kind, prefix in (("add", "A "), ("delete", "D "), ("modify", "M ")):
+            for path in status.staged.get(kind, []):
+                lines.append(f"{prefix} {os.fsdecode(path)}")
+        lines.extend(f" M {os.fsdecode(path)}" for path in status.unstaged)
+        lines.extend(f"?? {os.fsdecode(path)}" for path in status.untracked)
+        return "\n".join(lines)
+    
+    import subprocess
+    kwargs = {}
+    if os.name == 'nt':
+        # Avoid allocating a console window for the git process
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    result = subprocess.run(['git', 'status', '--porcelain'],
+                            capture_output=True, text=True, **kwargs)
+    return result.stdout.strip()
 
 if __name__ == "__main__":
     print("🚀 Excel Product Extractor - GitHub Setup Checker")
@@ -131,21 +131,18 @@ a = Analysis(
 # Create PYZ archive
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-# Create the executable
+# Create the executable (onedir: binaries/data are collected next to it,
+# so launches don't unpack the bundle to a temp dir every time)
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name=APP_NAME,
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,  # Use UPX compression to reduce file size
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,  # UPX slows both the build and every launch
     console=False,  # Hide console window (GUI app)
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -157,14 +154,14 @@ exe = EXE(
     # icon='app_icon.ico',  # Will create this if needed
 )
 
-# Create a COLLECT for directory distribution (alternative to single exe)
+# Create the directory distribution: dist/ExcelProductExtractor/
 coll = COLLECT(
     exe,
     a.binaries,
     a.zipfiles,
     a.datas,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
-    name=APP_NAME + '_dist'
+    name=APP_NAME
 )
\ No newline at end of file
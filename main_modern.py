@@ -3,21 +3,124 @@
 
 import sys
 import os
+import argparse
+import hashlib
+import pickle
+import tempfile
 from pathlib import Path
 
-# Add src directory to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+APP_NAME = "Excel Processor & Web Scraper"
+APP_VERSION = "1.0.0"
 
-def main():
+SRC_PATH = Path(__file__).parent / "src"
+CONFIG_PATH = os.path.join("config", "settings.yaml")
+CONFIG_CACHE_DIR = Path.home() / ".cache" / "excel_extractor"
+
+# Code that shapes the pickled AppConfig - a change to either invalidates the cache
+CONFIG_CODE_PATHS = (SRC_PATH / "models" / "config_models.py", SRC_PATH / "utils" / "config.py")
+
+def _config_cache_key(settings_stat):
+    """Key a cached config by app version, settings.yaml and the config code's mtime/size."""
+    parts = [APP_VERSION, os.path.abspath(CONFIG_PATH), str(settings_stat.st_mtime_ns), str(settings_stat.st_size)]
+    for path in CONFIG_CODE_PATHS:
+        try:
+            code_stat = os.stat(path)
+            parts.append(f"{code_stat.st_mtime_ns}:{code_stat.st_size}")
+        except OSError:
+            parts.append("-")  # Frozen builds ship bytecode only; APP_VERSION covers them
+    return hashlib.sha256(":".join(parts).encode('utf-8')).hexdigest()[:16]
+
+def _prune_config_cache(keep):
+    """Delete cached configs other than keep, so stale pickles don't pile up."""
+    for old_file in CONFIG_CACHE_DIR.glob("cfg-*.pkl"):
+        if old_file != keep:
+            try:
+                old_file.unlink()
+            except OSError:
+                pass
+
+def _load_configuration_cached():
+    """Load configuration, reusing a pickled copy while settings.yaml and the config code are unchanged."""
+    from utils.config import load_configuration
+    
+    try:
+        stat = os.stat(CONFIG_PATH)
+    except OSError:
+        # No settings file yet - let load_configuration create the default
+        return load_configuration()
+    
+    cache_file = CONFIG_CACHE_DIR / f"cfg-{_config_cache_key(stat)}.pkl"
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        pass  # Cache miss or unreadable cache - parse the YAML
+    
+    config = load_configuration()
+    
+    # Never write a second plaintext copy of a secret outside settings.yaml
+    if config.azure.api_key:
+        _prune_config_cache(keep=None)
+        return config
+    
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CONFIG_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(config, f, protocol=5)
+            os.replace(tmp_path, cache_file)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        _prune_config_cache(keep=cache_file)
+    except Exception:
+        pass  # Caching is best-effort
+    
+    return config
+
+def _setup_path():
+    """Add src directory to Python path (only when actually running the app)."""
+    if str(SRC_PATH) not in sys.path:
+        sys.path.insert(0, str(SRC_PATH))
+
+def _parse_args(argv=None):
+    """Parse command line arguments before any heavy imports."""
+    parser = argparse.ArgumentParser(description=APP_NAME)
+    parser.add_argument("--version", action="version", version=f"{APP_NAME} {APP_VERSION}")
+    parser.add_argument(
+        "--check-config",
+        action="store_true",
+        help="load the configuration, print a summary and exit"
+    )
+    # Tolerate unknown arguments (e.g. ones injected by OS launchers)
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+def _check_config():
+    """Load configuration and print a short summary without starting the GUI."""
+    config = _load_configuration_cached()
+    print(f"✅ Configuration loaded: {config.app_name} {config.app_version}")
+    print(f"   Concurrent requests: {config.scraping.concurrent_requests}")
+    print(f"   Azure enabled: {config.azure.enabled}")
+    print(f"   Preserve formatting: {config.output.preserve_formatting}")
+
+def main(argv=None):
     """Main entry point with modern UI."""
+    args = _parse_args(argv)
+    _setup_path()
+    
     try:
-        # Import after path setup
-        from utils.config import load_configuration
+        if args.check_config:
+            _check_config()
+            return
+        
+        # Import after path setup - the GUI stack is only needed to run the app
         from gui.modern_window import ModernExcelProcessorApp
         
         # Load configuration
-        config = load_configuration()
+        config = _load_configuration_cached()
         
         # Create and run modern application
         app = ModernExcelProcessorApp(config)
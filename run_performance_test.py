@@ -22,6 +22,27 @@ sys.path.insert(0, str(Path(__file__).parent / "tests"))
 
 from system_performance_test import main
 
+# Use a libuv-based event loop when available (uvloop on POSIX, winloop on Windows)
+try:
+    if sys.platform == 'win32':
+        import winloop as fast_loop
+    else:
+        import uvloop as fast_loop
+    FAST_LOOP_AVAILABLE = True
+except ImportError:
+    FAST_LOOP_AVAILABLE = False
+
+
+def run_async(coro):
+    """Run a coroutine on the fastest available event loop."""
+    if FAST_LOOP_AVAILABLE:
+        if hasattr(asyncio, "Runner"):  # Python 3.11+
+            with asyncio.Runner(loop_factory=fast_loop.new_event_loop) as runner:
+                return runner.run(coro)
+        fast_loop.install()
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
     print("🚀 Starting Excel Processor & Web Scraper Performance Test Suite...")
     print("=" * 70)
@@ -35,7 +56,7 @@ if __name__ == "__main__":
     print()
     
     try:
-        results = asyncio.run(main())
+        results = run_async(main())
         
         summary = results.get("summary", {})
         if summary.get('failed', 0) == 0:
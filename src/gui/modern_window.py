@@ -4,10 +4,15 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
-import threading
+import errno
+import shutil
+import time
 import asyncio
+import concurrent.futures
+import logging
 import json
-from typing import List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +21,93 @@ from models.processing_result import ProcessingStatus
 from utils.logger import get_logger, AdvancedProgressTracker
 from utils.validators import validate_excel_file
 from processing.integration_processor import IntegrationProcessor
+from gui.virtual_list import VirtualList
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# How often the Tk mainloop drives the asyncio event loop
+PUMP_INTERVAL_MS = 5
+PUMP_IDLE_INTERVAL_MS = 50
+
+# Minimum interval between progress repaints (10 FPS)
+PROGRESS_REPAINT_MS = 100
+
+# Maximum number of rejected files listed in the error dialog
+MAX_INVALID_FILES_SHOWN = 20
+
+# Resume-state saves are coalesced to at most one write per interval
+STATE_FLUSH_MS = 1000
+
+# Quiet period after the last <Configure> before resize work runs
+RESIZE_DEBOUNCE_MS = 100
+
+# Row slot heights for the virtualised lists (row height plus spacing)
+FILE_ROW_HEIGHT = 48
+RESULT_ROW_HEIGHT = 96
+
+
+# Progress stats line templates, formatted on every repaint
+_STATS_CACHE_FMT = "✅ {:.1f}% success • ⚡ {:.1f} items/sec • 💾 {:.1f}% cache hits"
+_STATS_CURRENT_FMT = "✅ {:.1f}% success • ⚡ {:.1f} items/sec • Currently: {}"
+_CURRENT_ITEM_FMT = "Currently processing: {}"
+
+
+def _short(text: str, limit: int) -> str:
+    """Truncate text to limit characters with an ellipsis (no copy when it already fits)."""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+# Errors meaning "this copy primitive can't handle these files" - fall back
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK}
+
+
+def _fast_copy(src: str, dst: str):
+    """
+    Copy a file using kernel-side copies where available.
+    
+    Tries os.copy_file_range (reflink/in-kernel copy), then os.sendfile,
+    then shutil.copyfile. File metadata is preserved like shutil.copy2.
+    """
+    primitives = []
+    if hasattr(os, "copy_file_range"):
+        primitives.append(lambda src_fd, dst_fd, offset, count: os.copy_file_range(src_fd, dst_fd, count, offset, offset))
+    if hasattr(os, "sendfile"):
+        primitives.append(lambda src_fd, dst_fd, offset, count: os.sendfile(dst_fd, src_fd, offset, count))
+    
+    copied = False
+    if primitives:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            size = os.fstat(src_fd).st_size
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                for copy_chunk in primitives:
+                    offset = 0
+                    try:
+                        while offset < size:
+                            sent = copy_chunk(src_fd, dst_fd, offset, size - offset)
+                            if sent == 0:
+                                break
+                            offset += sent
+                    except OSError as e:
+                        if e.errno not in _COPY_FALLBACK_ERRNOS:
+                            raise
+                        continue
+                    if offset >= size:
+                        copied = True
+                        break
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
 
 
 class ModernExcelProcessorApp:
@@ -28,21 +120,78 @@ class ModernExcelProcessorApp:
         
         # App state
         self.selected_files: List[str] = []
+        # Mirror of selected_files for O(1) membership checks
+        self._selected_set: Set[str] = set()
         self.processing_active = False
         self.processing_paused = False
         self.current_progress_tracker: Optional[AdvancedProgressTracker] = None
         
+        # Asyncio loop driven from the Tk mainloop (single-threaded)
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        # Persistent pool for blocking workbook I/O, reused across runs
+        self._executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="proc")
+        self.loop.set_default_executor(self._executor)
+        self.processing_task: Optional[asyncio.Task] = None
+        
+        # Set while running, cleared while paused - callbacks wait on it
+        self._pause_event = asyncio.Event()
+        self._pause_event.set()
+        
+        # Coalesced progress updates - only the latest one is painted
+        self._pending_progress: Optional[tuple] = None
+        self._progress_scheduled = False
+        
+        # Last rendered text for the progress widgets
+        self._last_progress_text: Optional[str] = None
+        self._last_stats_text: Optional[str] = None
+        
+        # Pending debounced resize callback
+        self._resize_after_id: Optional[str] = None
+        
+        # File sizes in MB, stat'ed once when a file is added
+        self._file_size_cache: Dict[str, float] = {}
+        
+        # Display names per path, so rows don't re-derive them on every render
+        self._basenames: Dict[str, str] = {}
+        
         # Processing state persistence
         self.processing_state_file = "cache/processing_state.json"
         self.resume_data: Optional[dict] = None
+        # Probed once here, then kept in sync by save/clear
+        self._resume_available = Path(self.processing_state_file).exists()
+        # Coalesced state saves - latest (current_file_index, completed_files) wins
+        self._state_dirty = False
+        self._pending_state: Optional[tuple] = None
+        self._state_after_id: Optional[str] = None
         
         # Setup modern UI
         self._setup_appearance()
         self._create_window()
+        self._create_fonts()
         self._create_interface()
         
+        # Start driving the asyncio loop from Tk
+        self.root.after(PUMP_INTERVAL_MS, self._tk_pump)
+        
         self.logger.info("Modern Excel Processor initialized")
     
+    def _tk_pump(self):
+        """Run all ready asyncio callbacks, then reschedule from the Tk mainloop."""
+        # A modal dialog runs a nested Tk loop; if it was opened while the asyncio loop
+        # was running, the next tick lands here re-entrantly - just try again later
+        if not self.loop.is_running():
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+        
+        # Poll quickly while work is in flight, back off when idle
+        busy = self.processing_task is not None and not self.processing_task.done()
+        self.root.after(PUMP_INTERVAL_MS if busy else PUMP_IDLE_INTERVAL_MS, self._tk_pump)
+    
+    def _show_dialog(self, show: Callable[[str, str], Any], title: str, message: str):
+        """Open a modal messagebox from the Tk mainloop, never from inside an asyncio callback."""
+        self.root.after(0, partial(show, title, message))
+    
     def _setup_appearance(self):
         """Setup modern appearance."""
         ctk.set_appearance_mode("dark")  # Force dark theme
@@ -62,6 +211,20 @@ class ModernExcelProcessorApp:
         # Bind resize event for responsive behavior
         self.root.bind('<Configure>', self._on_window_resize)
     
+    def _create_fonts(self):
+        """Create shared font objects once (needs the root window to exist)."""
+        self.F_TITLE = ctk.CTkFont(size=22, weight="bold")
+        self.F_TITLE_MEDIUM = ctk.CTkFont(size=20, weight="bold")
+        self.F_H2 = ctk.CTkFont(size=18, weight="bold")
+        self.F_H3 = ctk.CTkFont(size=16, weight="bold")
+        self.F_BUTTON = ctk.CTkFont(size=14, weight="bold")
+        self.F_ICON = ctk.CTkFont(size=32)
+        self.F_LARGE = ctk.CTkFont(size=16)
+        self.F_BODY = ctk.CTkFont(size=14)
+        self.F_TEXT = ctk.CTkFont(size=13)
+        self.F_SMALL = ctk.CTkFont(size=12)
+        self.F_TINY = ctk.CTkFont(size=11)
+    
     def _create_interface(self):
         """Create modern, clean interface."""
         
@@ -81,9 +244,9 @@ class ModernExcelProcessorApp:
         self.content_frame.grid_rowconfigure(0, weight=0)  # Upload area
         self.content_frame.grid_rowconfigure(1, weight=1)  # Results area
         
-        # Create sections
+        # Create sections - the results section is built on first use
         self._create_upload_section()
-        self._create_results_section()
+        self._results_container: Optional[ctk.CTkFrame] = None
         
         # Footer with action buttons
         self._create_footer()
@@ -104,9 +267,10 @@ class ModernExcelProcessorApp:
         self.title_label = ctk.CTkLabel(
             header_frame,
             text="Excel Processor & Web Scraper",
-            font=ctk.CTkFont(size=22, weight="bold")  # Slightly smaller for better fit
+            font=self.F_TITLE  # Slightly smaller for better fit
         )
         self.title_label.grid(row=0, column=0, sticky="w", padx=20, pady=25)  # Less padding
+        self._current_title_text = "Excel Processor & Web Scraper"
         
         # Progress container (hidden initially) - responsive design
         self.progress_container = ctk.CTkFrame(header_frame, fg_color="transparent")
@@ -122,7 +286,7 @@ class ModernExcelProcessorApp:
         self.progress_text = ctk.CTkLabel(
             self.progress_container,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=self.F_SMALL,
             text_color=("gray70", "gray30")
         )
         self.progress_text.grid(row=1, column=0, sticky="ew", pady=(0, 5))
@@ -131,7 +295,7 @@ class ModernExcelProcessorApp:
         self.stats_text = ctk.CTkLabel(
             self.progress_container,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=self.F_TINY,
             text_color=("gray60", "gray40")
         )
         self.stats_text.grid(row=2, column=0, sticky="ew", pady=(0, 15))
@@ -155,7 +319,7 @@ class ModernExcelProcessorApp:
         upload_title = ctk.CTkLabel(
             upload_container,
             text="Select Excel Files",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H2
         )
         upload_title.grid(row=0, column=0, sticky="w", padx=25, pady=(20, 10))
         
@@ -173,14 +337,14 @@ class ModernExcelProcessorApp:
         upload_icon = ctk.CTkLabel(
             drop_content,
             text="📁",
-            font=ctk.CTkFont(size=32)
+            font=self.F_ICON
         )
         upload_icon.grid(row=0, column=0, pady=(10, 5))
         
         upload_text = ctk.CTkLabel(
             drop_content,
             text="Drag & drop Excel files here",
-            font=ctk.CTkFont(size=16),
+            font=self.F_LARGE,
             text_color=("gray60", "gray40")
         )
         upload_text.grid(row=1, column=0, pady=(0, 5))
@@ -193,7 +357,7 @@ class ModernExcelProcessorApp:
             width=140,
             height=36,
             corner_radius=8,
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.F_BUTTON
         )
         self.browse_button.grid(row=2, column=0, pady=(5, 10))
         
@@ -210,11 +374,14 @@ class ModernExcelProcessorApp:
         )
         self.files_scroll.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         
-        # Initial empty state
+        # Only the visible file rows get widgets
+        self.files_list = VirtualList(self.files_scroll, FILE_ROW_HEIGHT, self._create_file_entry)
+        
+        # Initial empty state (toggled with pack/pack_forget)
         self.no_files_label = ctk.CTkLabel(
             self.files_scroll,
             text="No files selected",
-            font=ctk.CTkFont(size=14),
+            font=self.F_BODY,
             text_color=("gray60", "gray40")
         )
         self.no_files_label.pack(pady=20)
@@ -226,12 +393,13 @@ class ModernExcelProcessorApp:
         results_container.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
         results_container.grid_columnconfigure(0, weight=1)
         results_container.grid_rowconfigure(1, weight=1)
+        self._results_container = results_container
         
         # Results title
         results_title = ctk.CTkLabel(
             results_container,
             text="Processing Results",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.F_H2
         )
         results_title.grid(row=0, column=0, sticky="w", padx=25, pady=(20, 10))
         
@@ -242,15 +410,23 @@ class ModernExcelProcessorApp:
         )
         self.results_scroll.grid(row=1, column=0, sticky="nsew", padx=25, pady=(0, 20))
         
+        # Only the visible result rows get widgets
+        self.results_list = VirtualList(self.results_scroll, RESULT_ROW_HEIGHT, self._create_result_entry)
+        
         # Placeholder for no results
         self.no_results_label = ctk.CTkLabel(
             self.results_scroll,
             text="No results yet. Select Excel files and click Process to begin.",
-            font=ctk.CTkFont(size=14),
+            font=self.F_BODY,
             text_color=("gray60", "gray40")
         )
         self.no_results_label.pack(pady=50)
     
+    def _ensure_results_section(self):
+        """Build the results section the first time it is needed."""
+        if self._results_container is None:
+            self._create_results_section()
+    
     def _create_footer(self):
         """Create action buttons footer."""
         footer_frame = ctk.CTkFrame(self.main_container, height=80, corner_radius=0)
@@ -258,7 +434,9 @@ class ModernExcelProcessorApp:
         footer_frame.grid_columnconfigure(1, weight=1)
         footer_frame.grid_propagate(False)
         
-        # Action buttons
+        # Action buttons - gridded once; optional buttons toggle with grid()/grid_remove()
+        # so Tk keeps their cell and options instead of repacking the whole row.
+        # Columns, left to right: export, pause/resume (shared cell), resume processing, clear, process
         button_container = ctk.CTkFrame(footer_frame, fg_color="transparent")
         button_container.grid(row=0, column=0, columnspan=2, pady=20)
         
@@ -270,10 +448,10 @@ class ModernExcelProcessorApp:
             width=160,
             height=44,
             corner_radius=8,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.F_H3,
             state="disabled"
         )
-        self.process_button.pack(side="right", padx=(10, 0))
+        self.process_button.grid(row=0, column=4, padx=(10, 0))
         
         # Pause/Resume button (hidden initially)
         self.pause_button = ctk.CTkButton(
@@ -283,11 +461,27 @@ class ModernExcelProcessorApp:
             width=120,
             height=44,
             corner_radius=8,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.F_BUTTON,
             fg_color="#ff6b35",
             hover_color="#e55a2b"
         )
-        # Initially hidden
+        self.pause_button.grid(row=0, column=1, padx=(10, 0))
+        self.pause_button.grid_remove()  # Initially hidden
+        
+        # Inline Resume twin - swapped into the pause button's slot while paused
+        self.resume_inline_button = ctk.CTkButton(
+            button_container,
+            text="▶️ Resume",
+            command=self._toggle_pause,
+            width=120,
+            height=44,
+            corner_radius=8,
+            font=self.F_BUTTON,
+            fg_color="#28a745",
+            hover_color="#218838"
+        )
+        self.resume_inline_button.grid(row=0, column=1, padx=(10, 0))
+        self.resume_inline_button.grid_remove()  # Initially hidden
         
         # Export Current Results button (hidden initially)
         self.export_button = ctk.CTkButton(
@@ -297,11 +491,12 @@ class ModernExcelProcessorApp:
             width=150,
             height=44,
             corner_radius=8,
-            font=ctk.CTkFont(size=14),
+            font=self.F_BODY,
             fg_color="#28a745",
             hover_color="#218838"
         )
-        # Initially hidden
+        self.export_button.grid(row=0, column=0, padx=(10, 0))
+        self.export_button.grid_remove()  # Initially hidden
         
         # Resume Processing button (hidden initially) 
         self.resume_button = ctk.CTkButton(
@@ -311,11 +506,12 @@ class ModernExcelProcessorApp:
             width=180,
             height=44,
             corner_radius=8,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.F_H3,
             fg_color="#007bff",
             hover_color="#0056b3"
         )
-        # Initially hidden
+        self.resume_button.grid(row=0, column=2, padx=(10, 0))
+        self.resume_button.grid_remove()  # Initially hidden
         
         # Clear button
         self.clear_button = ctk.CTkButton(
@@ -325,12 +521,12 @@ class ModernExcelProcessorApp:
             width=100,
             height=44,
             corner_radius=8,
-            font=ctk.CTkFont(size=14),
+            font=self.F_BODY,
             fg_color="transparent",
             border_width=2,
             state="disabled"
         )
-        self.clear_button.pack(side="right")
+        self.clear_button.grid(row=0, column=3)
     
     def _browse_files(self):
         """Open file browser."""
@@ -346,125 +542,169 @@ class ModernExcelProcessorApp:
                 multiple=True
             )
             
-            self.logger.info(f"🔍 DEBUG: File dialog returned {len(file_paths)} files: {list(file_paths)}")
+            self.logger.debug("🔍 File dialog returned %d files: %s", len(file_paths), file_paths)
             
             if file_paths:
                 self._add_files(list(file_paths))
             else:
-                self.logger.info("🔍 DEBUG: No files selected in dialog")
+                self.logger.debug("🔍 No files selected in dialog")
                 
         except Exception as e:
             self.logger.error(f"File browser error: {e}")
             messagebox.showerror("Error", f"Failed to open file browser: {e}")
     
     def _add_files(self, file_paths: List[str]):
-        """Add files to selection."""
-        self.logger.info(f"🔍 DEBUG: _add_files called with {len(file_paths)} paths")
+        """Add files to selection (validation runs off the Tk thread)."""
+        self.loop.create_task(self._add_files_async(file_paths))
+    
+    async def _add_files_async(self, file_paths: List[str]):
+        """Validate candidate files in the executor, then add the valid ones."""
+        # Per-file debug logging is skipped entirely unless DEBUG is enabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("🔍 _add_files called with %d paths", len(file_paths))
         valid_files = []
         invalid_files = []
         
+        # Only validate files that aren't selected yet (and each path once)
+        new_paths = []
+        seen = set(self._selected_set)
         for file_path in file_paths:
-            self.logger.info(f"🔍 DEBUG: Validating file: {file_path}")
-            if file_path not in self.selected_files:
-                is_valid, error_msg = validate_excel_file(file_path)
-                self.logger.info(f"🔍 DEBUG: File validation result - Valid: {is_valid}, Error: {error_msg}")
-                if is_valid:
-                    valid_files.append(file_path)
-                    self.selected_files.append(file_path)
-                    self.logger.info(f"✅ DEBUG: Added valid file: {Path(file_path).name}")
-                else:
-                    invalid_files.append((file_path, error_msg))
-                    self.logger.warning(f"❌ DEBUG: Rejected file: {Path(file_path).name} - {error_msg}")
+            if file_path in seen:
+                if debug:
+                    self.logger.debug("🔍 File already selected: %s", self._basename(file_path))
             else:
-                self.logger.info(f"🔍 DEBUG: File already selected: {Path(file_path).name}")
+                seen.add(file_path)
+                new_paths.append(file_path)
+        
+        # Validation opens each workbook - run them concurrently in the thread pool
+        validations = await asyncio.gather(*[
+            self.loop.run_in_executor(None, validate_excel_file, file_path)
+            for file_path in new_paths
+        ])
+        
+        for file_path, (is_valid, error_msg) in zip(new_paths, validations):
+            if debug:
+                self.logger.debug("🔍 File validation result for %s - Valid: %s, Error: %s", file_path, is_valid, error_msg)
+            # Another drop may have added it while we were validating
+            if file_path in self._selected_set:
+                continue
+            if is_valid:
+                valid_files.append(file_path)
+                self.selected_files.append(file_path)
+                self._selected_set.add(file_path)
+                self._cache_file_size(file_path)
+                if debug:
+                    self.logger.debug("✅ Added valid file: %s", self._basename(file_path))
+            else:
+                invalid_files.append((file_path, error_msg))
+                self.logger.warning("❌ Rejected file: %s - %s", self._basename(file_path), error_msg)
         
-        self.logger.info(f"🔍 DEBUG: Final counts - Valid: {len(valid_files)}, Invalid: {len(invalid_files)}, Total selected: {len(self.selected_files)}")
+        self.logger.debug(
+            "🔍 Final counts - Valid: %d, Invalid: %d, Total selected: %d",
+            len(valid_files), len(invalid_files), len(self.selected_files)
+        )
         
         # Show errors for invalid files
         if invalid_files:
-            error_text = "\n".join([f"• {Path(f[0]).name}: {f[1]}" for f in invalid_files])
-            messagebox.showerror("Invalid Files", f"Some files could not be added:\n\n{error_text}")
+            # Cap the list - a dialog with hundreds of lines freezes Tk
+            error_text = "\n".join(
+                f"• {self._basename(path)}: {msg}"
+                for path, msg in invalid_files[:MAX_INVALID_FILES_SHOWN]
+            )
+            if len(invalid_files) > MAX_INVALID_FILES_SHOWN:
+                error_text += f"\n…and {len(invalid_files) - MAX_INVALID_FILES_SHOWN} more"
+            # Runs inside the pumped asyncio loop - the modal dialog must open from Tk
+            self._show_dialog(messagebox.showerror, "Invalid Files", f"Some files could not be added:\n\n{error_text}")
         
         # Update UI
         if valid_files:
-            self.logger.info(f"🔄 DEBUG: Updating files display and buttons")
+            self.logger.debug("🔄 Updating files display and buttons")
             self._update_files_display()
             self._update_buttons()
         else:
-            self.logger.warning(f"⚠️ DEBUG: No valid files to update display")
+            self.logger.debug("⚠️ No valid files to update display")
     
     def _update_files_display(self):
-        """Update files display with visual indicators."""
-        self.logger.info(f"🔄 DEBUG: _update_files_display called with {len(self.selected_files)} files")
-        
-        # Clear existing file widgets
-        for widget in self.files_scroll.winfo_children():
-            widget.destroy()
+        """Update files display - only the visible rows are rendered."""
+        self.logger.debug("🔄 _update_files_display called with %d files", len(self.selected_files))
         
         if not self.selected_files:
-            self.logger.info(f"🔄 DEBUG: No files selected, showing empty state")
-            # Show empty state
-            self.no_files_label = ctk.CTkLabel(
-                self.files_scroll,
-                text="No files selected",
-                font=ctk.CTkFont(size=14),
-                text_color=("gray60", "gray40")
-            )
+            self.logger.debug("🔄 No files selected, showing empty state")
+            self.files_list.set_items([])
             self.no_files_label.pack(pady=20)
             return
         
-        self.logger.info(f"🔄 DEBUG: Creating file widgets for {len(self.selected_files)} files")
+        # The placeholder is created once and only hidden, never destroyed
+        self.no_files_label.pack_forget()
+        self.files_list.set_items(self.selected_files)
+    
+    def _create_file_entry(self, parent: ctk.CTkFrame, index: int, file_path: str) -> ctk.CTkFrame:
+        """Create the row widget for a single selected file."""
+        file_frame = ctk.CTkFrame(parent, height=FILE_ROW_HEIGHT - 4, corner_radius=6)
+        
+        # File icon and name
+        file_info = ctk.CTkLabel(
+            file_frame,
+            text=f"📊 {self._basename(file_path)}",
+            font=self.F_TEXT,
+            anchor="w"
+        )
+        file_info.grid(row=0, column=0, sticky="w", padx=10, pady=8)
+        
+        # File size
+        size_mb = self._file_size_cache.get(file_path)
+        if size_mb is None:
+            size_mb = self._cache_file_size(file_path)
+        size_text = f"{size_mb:.1f} MB" if size_mb is not None else "Unknown size"
+        
+        size_label = ctk.CTkLabel(
+            file_frame,
+            text=size_text,
+            font=self.F_TINY,
+            text_color=("gray60", "gray40")
+        )
+        size_label.grid(row=0, column=1, sticky="e", padx=10, pady=8)
+        
+        # Remove button - bound to the path, so it stays valid when rows are re-rendered
+        remove_btn = ctk.CTkButton(
+            file_frame,
+            text="✕",
+            command=partial(self._remove_file, file_path),
+            width=30,
+            height=24,
+            corner_radius=4,
+            font=self.F_SMALL,
+            fg_color="transparent",
+            hover_color=("gray80", "gray20")
+        )
+        remove_btn.grid(row=0, column=2, padx=(5, 10), pady=8)
         
-        # Show selected files with icons
-        for i, file_path in enumerate(self.selected_files):
-            file_frame = ctk.CTkFrame(self.files_scroll, corner_radius=6)
-            file_frame.pack(fill="x", padx=5, pady=2)
-            
-            # File icon and name
-            file_info = ctk.CTkLabel(
-                file_frame,
-                text=f"📊 {Path(file_path).name}",
-                font=ctk.CTkFont(size=13),
-                anchor="w"
-            )
-            file_info.grid(row=0, column=0, sticky="w", padx=10, pady=8)
-            
-            # File size
-            try:
-                size_mb = os.path.getsize(file_path) / (1024 * 1024)
-                size_text = f"{size_mb:.1f} MB"
-            except:
-                size_text = "Unknown size"
-            
-            size_label = ctk.CTkLabel(
-                file_frame,
-                text=size_text,
-                font=ctk.CTkFont(size=11),
-                text_color=("gray60", "gray40")
-            )
-            size_label.grid(row=0, column=1, sticky="e", padx=10, pady=8)
-            
-            # Remove button
-            remove_btn = ctk.CTkButton(
-                file_frame,
-                text="✕",
-                command=lambda idx=i: self._remove_file(idx),
-                width=30,
-                height=24,
-                corner_radius=4,
-                font=ctk.CTkFont(size=12),
-                fg_color="transparent",
-                hover_color=("gray80", "gray20")
-            )
-            remove_btn.grid(row=0, column=2, padx=(5, 10), pady=8)
-            
-            file_frame.grid_columnconfigure(0, weight=1)
+        file_frame.grid_columnconfigure(0, weight=1)
+        return file_frame
     
-    def _remove_file(self, index: int):
+    def _basename(self, file_path: str) -> str:
+        """Return the file name of a path, computed once per path."""
+        name = self._basenames.get(file_path)
+        if name is None:
+            name = self._basenames[file_path] = os.path.basename(file_path)
+        return name
+    
+    def _cache_file_size(self, file_path: str) -> Optional[float]:
+        """Stat a file once and remember its size in MB."""
+        try:
+            size_mb = os.path.getsize(file_path) / 1048576.0
+        except OSError:
+            return None
+        self._file_size_cache[file_path] = size_mb
+        return size_mb
+    
+    def _remove_file(self, file_path: str):
         """Remove a file from selection."""
-        if 0 <= index < len(self.selected_files):
-            removed_file = self.selected_files.pop(index)
-            self.logger.info(f"Removed file: {Path(removed_file).name}")
+        if file_path in self._selected_set:
+            self.selected_files.remove(file_path)
+            self._selected_set.discard(file_path)
+            self.logger.info(f"Removed file: {self._basename(file_path)}")
             self._update_files_display()
             self._update_buttons()
     
@@ -481,13 +721,14 @@ class ModernExcelProcessorApp:
         
         # Check for resume data
         if self._has_resume_data() and not self.processing_active:
-            self.resume_button.pack(side="right", padx=(10, 0))
+            self.resume_button.grid()
         else:
-            self.resume_button.pack_forget()
+            self.resume_button.grid_remove()
     
     def _clear_files(self):
         """Clear selected files."""
         self.selected_files.clear()
+        self._selected_set.clear()
         self._update_files_display()
         self._update_buttons()
         self._clear_results()
@@ -495,17 +736,12 @@ class ModernExcelProcessorApp:
     
     def _clear_results(self):
         """Clear results display."""
+        self._ensure_results_section()
+        
         # Clear all result widgets
-        for widget in self.results_scroll.winfo_children():
-            widget.destroy()
+        self.results_list.set_items([])
         
         # Show placeholder
-        self.no_results_label = ctk.CTkLabel(
-            self.results_scroll,
-            text="No results yet. Select Excel files and click Process to begin.",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray60", "gray40")
-        )
         self.no_results_label.pack(pady=50)
     
     def _process_files(self):
@@ -515,38 +751,34 @@ class ModernExcelProcessorApp:
         
         self.processing_active = True
         self.processing_paused = False
+        self._pause_event.set()
         self._update_buttons()
         self._clear_results()
         self._show_processing_controls()
         
-        # Start processing thread
-        thread = threading.Thread(target=self._process_thread)
-        thread.daemon = True
-        thread.start()
+        # Schedule processing on the Tk-driven event loop
+        self.processing_task = self.loop.create_task(self._run_processing())
     
-    def _process_thread(self):
-        """Enhanced processing thread with advanced progress tracking."""
+    async def _run_processing(self):
+        """Run processing with advanced progress tracking and restore the UI afterwards."""
         try:
-            # Update UI
-            self.root.after(0, lambda: self._update_status("Initializing processing..."))
+            self._update_status("Initializing processing...")
             
-            # Run async processing
-            asyncio.run(self._process_files_async_enhanced())
+            await self._process_files_async_enhanced()
             
         except Exception as e:
             error_msg = f"Processing failed: {str(e)}"
             self.logger.error(error_msg)
-            self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
+            self._show_dialog(messagebox.showerror, "Error", error_msg)
         
         finally:
             self.processing_active = False
             self.processing_paused = False
-            self.root.after(0, lambda: [
-                self._hide_processing_controls(),
-                self._hide_progress_display(),
-                self._update_buttons(),
-                self._update_status("Ready")
-            ])
+            self._pause_event.set()
+            self._hide_processing_controls()
+            self._hide_progress_display()
+            self._update_buttons()
+            self._update_status("Ready")
     
     async def _process_files_async_enhanced(self):
         """Enhanced async file processing with advanced progress tracking and pause/resume."""
@@ -564,23 +796,45 @@ class ModernExcelProcessorApp:
         # Add GUI progress callback
         self.current_progress_tracker.add_progress_callback(self._gui_progress_callback)
         
+        # Files that finished, in completion order - saved (coalesced) for resume
+        files = list(self.selected_files)
+        completed_files: List[str] = []
+        
+        # Up to max_concurrent_files report interleaved, so keep each file's latest
+        # state and paint one combined figure instead of whichever file spoke last
+        file_fractions = [0.0] * len(files)
+        file_messages = [""] * len(files)
+        
         # Simple working callback - restore original functionality  
         async def enhanced_progress_callback(message: str, progress: float, current_file: int, total_files: int):
-            # Check for pause
-            while self.processing_paused and self.processing_active:
-                await asyncio.sleep(0.1)
+            # A file reports 1.0 exactly once, when its output has been written
+            if progress >= 1.0:
+                completed_files.append(files[current_file - 1])
+                self._mark_state_dirty(current_file, list(completed_files))
+            
+            # Check for pause - wakes immediately on resume, no polling
+            if not self._pause_event.is_set():
+                await self._pause_event.wait()
             
             # Check if still processing (not cancelled)
             if not self.processing_active:
                 return
                 
-            # Use the original working approach with file progress
-            file_progress = (progress * 100)
+            # A failed file reports 0.0 - keep its furthest point so the bar never goes back
+            index = current_file - 1
+            file_fractions[index] = max(file_fractions[index], min(progress, 1.0))
+            file_messages[index] = message
+            
+            overall_percent = sum(file_fractions) / total_files * 100
+            finished = sum(1 for fraction in file_fractions if fraction >= 1.0)
             
-            # Update progress display with original logic
-            self.root.after(0, lambda: self._update_progress_display(
-                current_file, total_files, file_progress, "", message, {}
-            ))
+            # The text follows the lowest unfinished file rather than jumping between files
+            shown = next((i for i, fraction in enumerate(file_fractions) if fraction < 1.0), index)
+            
+            # Queue progress display update
+            self._schedule_progress(
+                finished, total_files, overall_percent, "", file_messages[shown] or message, {}
+            )
         
         try:
             # Process files with enhanced callback
@@ -591,12 +845,17 @@ class ModernExcelProcessorApp:
             
             self.current_results = results
             
+            # Nothing left to resume once every file succeeded; otherwise the queued
+            # save keeps the completed list so a resume skips those files
+            if all(result.status is ProcessingStatus.COMPLETED for result in results):
+                self._clear_processing_state()
+            
             # Complete progress tracking
             if self.current_progress_tracker:
                 self.current_progress_tracker.complete("All files processed successfully!")
             
             # Update results display
-            self.root.after(0, lambda: self._display_results(results))
+            self._display_results(results)
             
         except Exception as e:
             if self.current_progress_tracker:
@@ -616,43 +875,71 @@ class ModernExcelProcessorApp:
                 'cache_misses': 0
             }
         
-        # Update GUI on main thread
-        self.root.after(0, lambda: self._update_progress_display(
+        # Already on the Tk thread - queue a coalesced repaint
+        self._schedule_progress(
             processed, total, percent, eta, current_item or "Processing...", stats
-        ))
+        )
+    
+    def _schedule_progress(self, *progress):
+        """Remember the latest progress and repaint at most once per PROGRESS_REPAINT_MS."""
+        self._pending_progress = progress
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.root.after(PROGRESS_REPAINT_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Paint the most recent queued progress update."""
+        self._progress_scheduled = False
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            self._update_progress_display(*progress)
     
     def _display_results(self, results):
         """Display processing results."""
-        # Clear placeholder
-        for widget in self.results_scroll.winfo_children():
-            widget.destroy()
+        self._ensure_results_section()
         
         if not results:
             self._clear_results()
             return
         
-        # Create result entries
-        for i, result in enumerate(results):
-            self._create_result_entry(i, result)
+        # Fewer results than shown - start over
+        if len(results) < len(self.results_list.items):
+            self.results_list.set_items([])
+        
+        # Only changed or new results touch the list
+        for index, result in enumerate(results):
+            self._append_result(result, index)
+    
+    def _append_result(self, result, index: Optional[int] = None):
+        """Add a result (or replace the one at index) without rebuilding the list."""
+        self._ensure_results_section()
+        
+        # Hide placeholder
+        self.no_results_label.pack_forget()
+        
+        if index is not None and index < len(self.results_list.items):
+            if self.results_list.items[index] is not result:
+                self.results_list.set_item(index, result)
+        else:
+            self.results_list.append(result)
     
-    def _create_result_entry(self, index: int, result):
+    def _create_result_entry(self, parent: ctk.CTkFrame, index: int, result) -> ctk.CTkFrame:
         """Create a result entry widget."""
         # Result container
-        result_frame = ctk.CTkFrame(self.results_scroll, corner_radius=8)
-        result_frame.pack(fill="x", padx=10, pady=5)
+        result_frame = ctk.CTkFrame(parent, height=RESULT_ROW_HEIGHT - 10, corner_radius=8)
         
         # File name
-        filename = Path(result.file_path).name
+        filename = self._basename(result.file_path)
         name_label = ctk.CTkLabel(
             result_frame,
             text=filename,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.F_BUTTON,
             anchor="w"
         )
         name_label.grid(row=0, column=0, sticky="w", padx=15, pady=(15, 5))
         
         # Status and stats
-        if result.status == ProcessingStatus.COMPLETED:
+        if result.status is ProcessingStatus.COMPLETED:
             status_text = f"✅ Completed • {result.successful_extractions}/{result.total_links} successful"
             status_color = ("green", "lightgreen")
         else:
@@ -662,7 +949,7 @@ class ModernExcelProcessorApp:
         status_label = ctk.CTkLabel(
             result_frame,
             text=status_text,
-            font=ctk.CTkFont(size=12),
+            font=self.F_SMALL,
             text_color=status_color,
             anchor="w"
         )
@@ -681,6 +968,7 @@ class ModernExcelProcessorApp:
             open_button.grid(row=0, column=1, rowspan=2, padx=15, pady=10)
         
         result_frame.grid_columnconfigure(0, weight=1)
+        return result_frame
     
     def _open_file(self, file_path: str):
         """Open file with system default application."""
@@ -689,19 +977,39 @@ class ModernExcelProcessorApp:
             import platform
             
             system = platform.system()
-            if system == "Darwin":  # macOS
-                subprocess.run(["open", file_path])
-            elif system == "Windows":
+            if system == "Windows":
                 os.startfile(file_path)
-            else:  # Linux
-                subprocess.run(["xdg-open", file_path])
+            else:
+                # Fire and forget - don't block the GUI waiting for the opener to exit
+                opener = "open" if system == "Darwin" else "xdg-open"  # macOS / Linux
+                subprocess.Popen(
+                    [opener, file_path],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
                 
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to open file: {e}")
+            self.logger.error(f"Failed to open file {file_path}: {e}")
     
     def _has_resume_data(self) -> bool:
         """Check if resume data exists."""
-        return Path(self.processing_state_file).exists()
+        return self._resume_available
+    
+    def _mark_state_dirty(self, current_file_index: int, completed_files: list):
+        """Queue a resume-state save; writes are batched to one per STATE_FLUSH_MS."""
+        self._pending_state = (current_file_index, completed_files)
+        self._state_dirty = True
+        if self._state_after_id is None:
+            self._state_after_id = self.root.after(STATE_FLUSH_MS, self._flush_state)
+    
+    def _flush_state(self):
+        """Write the most recent queued state, if any."""
+        self._state_after_id = None
+        if self._state_dirty:
+            self._state_dirty = False
+            self._save_processing_state(*self._pending_state)
     
     def _save_processing_state(self, current_file_index: int, completed_files: list):
         """Save current processing state for resume functionality."""
@@ -714,10 +1022,21 @@ class ModernExcelProcessorApp:
                 "processing_paused": True
             }
             
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(state)
+            else:
+                data = json.dumps(state, separators=(',', ':')).encode('utf-8')
+            
+            # Write to a temp file and rename so a crash never corrupts the resume data
             os.makedirs(os.path.dirname(self.processing_state_file), exist_ok=True)
-            with open(self.processing_state_file, 'w') as f:
-                json.dump(state, f, indent=2)
-                
+            tmp_path = self.processing_state_file + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.processing_state_file)
+            self._resume_available = True
+            
             self.logger.info("Processing state saved for resume")
         except Exception as e:
             self.logger.error(f"Failed to save processing state: {e}")
@@ -726,17 +1045,25 @@ class ModernExcelProcessorApp:
         """Load saved processing state."""
         try:
             if Path(self.processing_state_file).exists():
-                with open(self.processing_state_file, 'r') as f:
-                    return json.load(f)
+                with open(self.processing_state_file, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
         except Exception as e:
             self.logger.error(f"Failed to load processing state: {e}")
         return None
     
     def _clear_processing_state(self):
         """Clear saved processing state."""
+        # Drop any queued save so it can't recreate the file afterwards
+        self._state_dirty = False
+        if self._state_after_id is not None:
+            self.root.after_cancel(self._state_after_id)
+            self._state_after_id = None
+        
         try:
             if Path(self.processing_state_file).exists():
                 os.unlink(self.processing_state_file)
+            self._resume_available = False
         except Exception as e:
             self.logger.error(f"Failed to clear processing state: {e}")
     
@@ -746,12 +1073,17 @@ class ModernExcelProcessorApp:
             self.processing_paused = not self.processing_paused
             
             if self.processing_paused:
-                self.pause_button.configure(text="▶️ Resume", fg_color="#28a745", hover_color="#218838")
-                self.export_button.pack(side="right", padx=(10, 0))
+                self._pause_event.clear()
+                # Swap buttons instead of reconfiguring (each configure redraws the canvas)
+                self.resume_inline_button.grid()
+                self.pause_button.grid_remove()
+                self.export_button.grid()
                 self._update_status("Processing paused")
             else:
-                self.pause_button.configure(text="⏸️ Pause", fg_color="#ff6b35", hover_color="#e55a2b")
-                self.export_button.pack_forget()
+                self._pause_event.set()
+                self.pause_button.grid()
+                self.resume_inline_button.grid_remove()
+                self.export_button.grid_remove()
                 self._update_status("Processing resumed")
     
     def _export_current_results(self):
@@ -760,16 +1092,16 @@ class ModernExcelProcessorApp:
             if hasattr(self, 'current_results') and self.current_results:
                 # Find the most recent output file
                 for result in reversed(self.current_results):
-                    if result.output_file_path and Path(result.output_file_path).exists():
-                        # Copy to a new file with timestamp
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        original_path = Path(result.output_file_path)
-                        export_path = original_path.parent / f"{original_path.stem}_partial_{timestamp}{original_path.suffix}"
+                    output_path = result.output_file_path
+                    if output_path and os.path.exists(output_path):
+                        # Copy to a new file with timestamp (plain os.path - no Path objects on the UI thread)
+                        timestamp = time.strftime("%Y%m%d_%H%M%S")
+                        base, ext = os.path.splitext(output_path)
+                        export_path = f"{base}_partial_{timestamp}{ext}"
                         
-                        import shutil
-                        shutil.copy2(result.output_file_path, export_path)
+                        _fast_copy(output_path, export_path)
                         
-                        messagebox.showinfo("Export Success", f"Current results exported to:\n{export_path.name}")
+                        messagebox.showinfo("Export Success", f"Current results exported to:\n{os.path.basename(export_path)}")
                         self.logger.info(f"Exported partial results to: {export_path}")
                         return
                 
@@ -785,7 +1117,10 @@ class ModernExcelProcessorApp:
         try:
             state = self._load_processing_state()
             if state:
-                self.selected_files = state["selected_files"]
+                # Files that already finished are not processed again
+                completed = set(state.get("completed_files", ()))
+                self.selected_files = [path for path in state["selected_files"] if path not in completed]
+                self._selected_set = set(self.selected_files)
                 self.resume_data = state
                 self._update_files_display()
                 self._process_files()
@@ -805,11 +1140,14 @@ class ModernExcelProcessorApp:
         
         # Update main progress text - show scraping progress if available in current_item
         if "scraping" in current_item.lower():
-            self.progress_text.configure(text=current_item)
+            progress_text = current_item
         else:
-            self.progress_text.configure(
-                text=f"Processing {processed:,}/{total:,} files ({percent:.1f}%)"
-            )
+            progress_text = f"Processing {processed:,}/{total:,} files ({percent:.1f}%)"
+        
+        # Only reconfigure labels whose text actually changed
+        if progress_text != self._last_progress_text:
+            self.progress_text.configure(text=progress_text)
+            self._last_progress_text = progress_text
         
         # Update detailed statistics if available
         if stats:
@@ -821,28 +1159,33 @@ class ModernExcelProcessorApp:
             # Only show cache stats if we have actual data
             if cache_hits > 0 or cache_misses > 0:
                 cache_rate = (cache_hits / (cache_hits + cache_misses) * 100)
-                stats_text = f"✅ {success_rate:.1f}% success • ⚡ {current_speed:.1f} items/sec • 💾 {cache_rate:.1f}% cache hits"
+                stats_text = _STATS_CACHE_FMT.format(success_rate, current_speed, cache_rate)
             else:
-                stats_text = f"✅ {success_rate:.1f}% success • ⚡ {current_speed:.1f} items/sec • Currently: {current_item[:40]}..."
-            
-            self.stats_text.configure(text=stats_text)
+                stats_text = _STATS_CURRENT_FMT.format(success_rate, current_speed, _short(current_item, 40))
         else:
             # Fallback when no statistics available
-            self.stats_text.configure(text=f"Currently processing: {current_item[:50]}...")
+            stats_text = _CURRENT_ITEM_FMT.format(_short(current_item, 50))
+        
+        if stats_text != self._last_stats_text:
+            self.stats_text.configure(text=stats_text)
+            self._last_stats_text = stats_text
     
     def _hide_progress_display(self):
         """Hide the progress display."""
+        # Drop any queued repaint so it doesn't re-show the container
+        self._pending_progress = None
         self.progress_container.grid_remove()
     
     def _show_processing_controls(self):
         """Show pause/resume controls during processing."""
-        self.pause_button.pack(side="right", padx=(10, 0))
+        self.pause_button.grid()
         self.process_button.configure(state="disabled")
     
     def _hide_processing_controls(self):
         """Hide processing controls when not processing."""
-        self.pause_button.pack_forget()
-        self.export_button.pack_forget()
+        self.pause_button.grid_remove()
+        self.resume_inline_button.grid_remove()
+        self.export_button.grid_remove()
         self.process_button.configure(state="normal" if self.selected_files else "disabled")
     
     def _update_status(self, message: str):
@@ -850,11 +1193,18 @@ class ModernExcelProcessorApp:
         pass  # Status label removed
     
     def _on_window_resize(self, event):
-        """Handle window resize events for responsive behavior."""
-        # Only handle resize events for the main window
-        if event.widget != self.root:
+        """Debounce window resize events - the layout update runs once per resize burst."""
+        # Only handle resize events for the main window, not bubbled child events
+        if event.widget is not self.root:
             return
-            
+        
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(RESIZE_DEBOUNCE_MS, self._do_resize)
+    
+    def _do_resize(self):
+        """Apply responsive layout changes for the current window size."""
+        self._resize_after_id = None
         width = self.root.winfo_width()
         height = self.root.winfo_height()
         
@@ -862,26 +1212,45 @@ class ModernExcelProcessorApp:
         if hasattr(self, 'title_label'):
             if width < 900:
                 # Smaller font for narrow windows
-                font_size = 18
+                title_font = self.F_H2
                 title_text = "Excel Processor"
             elif width < 1100:
                 # Medium font for medium windows
-                font_size = 20
+                title_font = self.F_TITLE_MEDIUM
                 title_text = "Excel Processor & Scraper"
             else:
                 # Full font for wide windows
-                font_size = 22
+                title_font = self.F_TITLE
                 title_text = "Excel Processor & Web Scraper"
             
-            # Update only if needed to prevent constant updates
-            current_text = self.title_label.cget('text')
-            if current_text != title_text:
+            # Update only if needed - compare against the cached text, no Tcl cget
+            if self._current_title_text != title_text:
                 self.title_label.configure(
                     text=title_text,
-                    font=ctk.CTkFont(size=font_size, weight="bold")
+                    font=title_font
                 )
+                self._current_title_text = title_text
     
     def run(self):
         """Start the application."""
         self.logger.info("Starting modern Excel processor")
-        self.root.mainloop()
\ No newline at end of file
+        try:
+            self.root.mainloop()
+        finally:
+            # Persist a queued state save the timer didn't get to
+            if self._state_dirty:
+                self._state_dirty = False
+                self._save_processing_state(*self._pending_state)
+            self._shutdown_loop()
+    
+    def _shutdown_loop(self):
+        """Cancel outstanding tasks and close the asyncio loop."""
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        # Close the shared HTTP session while its loop is still open
+        self.loop.run_until_complete(self.integration_processor.aclose())
+        # Also shuts down the default executor
+        self.loop.close()
\ No newline at end of file
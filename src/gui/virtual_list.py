@@ -0,0 +1,110 @@
+"""Virtualised row list for CTkScrollableFrame - only visible rows get widgets."""
+
+import math
+from typing import Any, Callable, Dict, List
+
+import customtkinter as ctk
+
+
+class VirtualList:
+    """
+    Render only the rows of a long list that are visible in a CTkScrollableFrame.
+
+    A fixed-height spacer is sized to the full list so the scrollbar behaves as
+    if every row existed; row widgets are placed inside it on demand and
+    destroyed when they scroll out of view. If the frame doesn't expose its
+    canvas and scrollbar, every row is rendered instead.
+    """
+
+    def __init__(
+        self,
+        scroll_frame: ctk.CTkScrollableFrame,
+        row_height: int,
+        create_row: Callable[[ctk.CTkFrame, int, Any], ctk.CTkFrame],
+        overscan: int = 2
+    ):
+        """
+        Args:
+            scroll_frame: Scrollable frame that hosts the list
+            row_height: Height of one row slot, including spacing
+            create_row: Builds the row widget for (parent, index, item)
+            overscan: Extra rows rendered above and below the viewport
+        """
+        self.scroll_frame = scroll_frame
+        self.row_height = row_height
+        self.create_row = create_row
+        self.overscan = overscan
+
+        self.items: List[Any] = []
+        self._visible_rows: Dict[int, ctk.CTkFrame] = {}
+
+        self.spacer = ctk.CTkFrame(scroll_frame, height=0, fg_color="transparent")
+        self.spacer.pack(fill="x")
+
+        # yscrollcommand fires on every view change (wheel, scrollbar drag, resize).
+        # These are CTkScrollableFrame internals, so fall back to rendering all rows.
+        self._canvas = getattr(scroll_frame, "_parent_canvas", None)
+        scrollbar = getattr(scroll_frame, "_scrollbar", None)
+        if self._canvas is not None and scrollbar is not None:
+            self._scrollbar_set = scrollbar.set
+            self._canvas.configure(yscrollcommand=self._on_yview)
+        else:
+            self._canvas = None
+
+    def set_items(self, items: List[Any]):
+        """Replace the list contents and re-render the visible rows."""
+        self.items = list(items)
+        for row in self._visible_rows.values():
+            row.destroy()
+        self._visible_rows.clear()
+
+        self.spacer.configure(height=max(len(items) * self.row_height, 1))
+        self.refresh()
+
+    def append(self, item: Any):
+        """Add one item at the end; a row is only created if it is in view."""
+        self.items.append(item)
+        self.spacer.configure(height=len(self.items) * self.row_height)
+        self.refresh()
+
+    def set_item(self, index: int, item: Any):
+        """Replace one item, re-rendering only its row if it is visible."""
+        self.items[index] = item
+        row = self._visible_rows.pop(index, None)
+        if row is not None:
+            row.destroy()
+            self.refresh()
+
+    def refresh(self):
+        """Create rows that scrolled into view and destroy rows that left it."""
+        count = len(self.items)
+        if self._canvas is None:
+            first, last = 0, count
+        else:
+            # Viewport in pixels relative to the spacer, so widgets packed next to it
+            # (like a placeholder label) don't shift the row range
+            offset = self.spacer.winfo_y()
+            view_top = self._canvas.canvasy(0) - offset
+            view_bottom = self._canvas.canvasy(self._canvas.winfo_height()) - offset
+
+            # Rendered row pitch, which includes CTk's widget scaling once mapped
+            spacer_height = self.spacer.winfo_height()
+            pitch = spacer_height / count if count and spacer_height > 1 else self.row_height
+
+            first = max(int(view_top // pitch) - self.overscan, 0)
+            last = min(math.ceil(view_bottom / pitch) + self.overscan, count)
+
+        for index in [i for i in self._visible_rows if not first <= i < last]:
+            self._visible_rows.pop(index).destroy()
+
+        for index in range(first, last):
+            if index not in self._visible_rows:
+                row = self.create_row(self.spacer, index, self.items[index])
+                row.grid_propagate(False)
+                row.place(x=0, y=index * self.row_height, relwidth=1)
+                self._visible_rows[index] = row
+
+    def _on_yview(self, top, bottom):
+        """Keep the scrollbar in sync and render the newly visible range."""
+        self._scrollbar_set(top, bottom)
+        self.refresh()
@@ -1,5 +1,6 @@
 """Configuration data models."""
 
+import functools
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
@@ -17,6 +18,8 @@ class ScrapingConfig:
     connection_pool_size: int = 25  # Maximum number of connections in pool
     dns_cache_ttl: int = 300  # DNS cache TTL in seconds
     enable_compression: bool = True  # Enable gzip/deflate compression
+    prefer_brotli: bool = False  # Also offer br (at lower priority); brotli decodes slower than gzip on our side
+    max_concurrent_files: int = 2  # Excel files processed at once (scraping still runs one file at a time)
     
     # User agents for rotation
     user_agents: List[str] = field(default_factory=lambda: [
@@ -122,15 +125,25 @@ class AppConfig:
     app_version: str = "1.0.0"
     developer: str = "James - Full Stack Developer"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary format."""
+    def __setattr__(self, name: str, value: Any):
+        # Any top-level change invalidates the memoised dict
+        self.__dict__.pop("_cached_dict", None)
+        super().__setattr__(name, value)
+    
+    @functools.cached_property
+    def _cached_dict(self) -> Dict[str, Any]:
+        """Dictionary form, built once until a field is reassigned."""
         return {
-            "scraping": self.scraping.__dict__,
-            "azure": self.azure.__dict__,
-            "output": self.output.__dict__,
-            "ui": self.ui.__dict__,
-            "logging": self.logging.__dict__,
+            "scraping": vars(self.scraping),
+            "azure": vars(self.azure),
+            "output": vars(self.output),
+            "ui": vars(self.ui),
+            "logging": vars(self.logging),
             "app_name": self.app_name,
             "app_version": self.app_version,
             "developer": self.developer
-        }
\ No newline at end of file
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert configuration to dictionary format."""
+        return dict(self._cached_dict)
\ No newline at end of file
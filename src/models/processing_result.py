@@ -1,10 +1,12 @@
 """Processing result models."""
 
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from .product_data import ProductData
+from .product_data import DATACLASS_SLOTS, ProductData
 
 
 class ProcessingStatus(Enum):
@@ -16,7 +18,11 @@ class ProcessingStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Statuses after which a processing run no longer changes
+_TERMINAL_STATUSES = frozenset({ProcessingStatus.COMPLETED, ProcessingStatus.FAILED, ProcessingStatus.CANCELLED})
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ScrapingResult:
     """Result of a single web scraping operation."""
     
@@ -27,11 +33,50 @@ class ScrapingResult:
     processing_time: float = 0.0  # in seconds
     attempts: int = 0
     extraction_method: str = "unknown"
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at_ns: int = field(default_factory=time.time_ns)  # epoch ns - cheaper than a datetime per result
+    
+    # Pooled messages for common failure kinds - every failed result shares one string
+    _ERROR_MSGS = {
+        kind: sys.intern(message) for kind, message in (
+            ("timeout", "Request timed out"),
+            ("http_error", "HTTP error"),
+            ("parse_error", "Parse error"),
+            ("blocked", "Blocked by site"),
+            ("no_strategy", "No suitable scraping strategy found"),
+            ("no_data", "No valid data extracted"),
+            ("extract_failed", "Failed to extract valid data"),
+        )
+    }
+    
+    def __post_init__(self):
+        """Share one string object per extraction method across results."""
+        if type(self.extraction_method) is str:
+            self.extraction_method = sys.intern(self.extraction_method)
+    
+    @classmethod
+    def for_failure(cls, url: str, kind: str, attempts: int = 1) -> "ScrapingResult":
+        """
+        Build a failed result with a pooled error message.
+        
+        Args:
+            url: URL that failed
+            kind: Failure kind from _ERROR_MSGS, or a free-form error message
+            attempts: Number of attempts made
+        """
+        error_message = cls._ERROR_MSGS.get(kind)
+        if error_message is None:
+            error_message = sys.intern(kind) if type(kind) is str and len(kind) < 200 else kind
+        return cls(url=url, status=ProcessingStatus.FAILED, error_message=error_message, attempts=attempts)
+    
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as a datetime (built on demand)."""
+        return datetime.fromtimestamp(self.created_at_ns / 1e9)
     
     def is_successful(self) -> bool:
         """Check if scraping was successful."""
-        return self.status == ProcessingStatus.COMPLETED and self.data is not None
+        # Identity check on the enum member - no __eq__ dispatch
+        return self.status is ProcessingStatus.COMPLETED and self.data is not None
     
     def get_confidence_score(self) -> float:
         """Get confidence score of extracted data."""
@@ -40,7 +85,7 @@ class ScrapingResult:
         return 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingResult:
     """Overall processing result for an Excel file."""
     
@@ -52,7 +97,7 @@ class ProcessingResult:
     failed_extractions: int = 0
     
     # Timing information
-    started_at: datetime = field(default_factory=datetime.now)
+    started_at_ns: int = field(default_factory=time.time_ns)
     completed_at: Optional[datetime] = None
     processing_time: float = 0.0
     
@@ -64,6 +109,11 @@ class ProcessingResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     
+    @property
+    def started_at(self) -> datetime:
+        """Start time as a datetime (built on demand)."""
+        return datetime.fromtimestamp(self.started_at_ns / 1e9)
+    
     def add_scraping_result(self, result: ScrapingResult):
         """Add a scraping result and update counters."""
         self.scraping_results.append(result)
@@ -78,35 +128,35 @@ class ProcessingResult:
         """Calculate success rate as a percentage."""
         if self.processed_links == 0:
             return 0.0
-        return (self.successful_extractions / self.processed_links) * 100
+        return self.successful_extractions * 100.0 / self.processed_links
     
     def get_progress_percentage(self) -> float:
         """Get processing progress as a percentage."""
         if self.total_links == 0:
             return 0.0
-        return (self.processed_links / self.total_links) * 100
+        return self.processed_links * 100.0 / self.total_links
     
     def is_completed(self) -> bool:
         """Check if processing is completed."""
-        return self.status in [ProcessingStatus.COMPLETED, ProcessingStatus.FAILED, ProcessingStatus.CANCELLED]
+        return self.status in _TERMINAL_STATUSES
     
     def mark_completed(self):
         """Mark processing as completed and calculate timing."""
-        self.completed_at = datetime.now()
+        end_ns = time.time_ns()
+        self.completed_at = datetime.fromtimestamp(end_ns / 1e9)
         self.status = ProcessingStatus.COMPLETED
-        if self.completed_at:
-            self.processing_time = (self.completed_at - self.started_at).total_seconds()
+        self.processing_time = (end_ns - self.started_at_ns) * 1e-9
     
     def mark_failed(self, error_message: str):
         """Mark processing as failed."""
-        self.completed_at = datetime.now()
+        end_ns = time.time_ns()
+        self.completed_at = datetime.fromtimestamp(end_ns / 1e9)
         self.status = ProcessingStatus.FAILED
         self.errors.append(error_message)
-        if self.completed_at:
-            self.processing_time = (self.completed_at - self.started_at).total_seconds()
+        self.processing_time = (end_ns - self.started_at_ns) * 1e-9
     
     def get_summary(self) -> Dict[str, Any]:
-        """Get a summary of processing results."""
+        """Get a summary of processing results (raw numbers - format when rendering)."""
         return {
             "file_path": self.file_path,
             "status": self.status.value,
@@ -114,8 +164,8 @@ class ProcessingResult:
             "processed_links": self.processed_links,
             "successful_extractions": self.successful_extractions,
             "failed_extractions": self.failed_extractions,
-            "success_rate": f"{self.get_success_rate():.1f}%",
-            "processing_time": f"{self.processing_time:.2f}s",
+            "success_rate": self.get_success_rate(),
+            "processing_time": self.processing_time,
             "output_file": self.output_file_path,
             "errors": len(self.errors),
             "warnings": len(self.warnings)
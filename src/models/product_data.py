@@ -1,12 +1,25 @@
 """Product data models and structures."""
 
+import re
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 import pandas as pd
 
+# Per-record models are created once per scraped URL, so drop their __dict__
+# where dataclass(slots=True) is available (Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Schemes ProductLink accepts as-is; anything else that looks like a host gets https://
+_SCHEME_RE = re.compile(r'https?://')
+
+# Seven core fields make up the completeness score
+_COMPLETENESS_FIELD_WEIGHT = 1.0 / 7.0
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProductData:
     """Represents extracted product information."""
     
@@ -26,36 +39,51 @@ class ProductData:
     # Extraction metadata
     extraction_confidence: float = 0.0
     source_url: str = ""
-    extracted_at: datetime = field(default_factory=datetime.now)
+    extracted_at_ns: int = field(default_factory=time.time_ns)  # epoch ns - cheaper than a datetime per record
     extraction_method: str = "unknown"
     
     # Additional extracted data (flexible)
     additional_data: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        """Share one string object per extraction method across records."""
+        if type(self.extraction_method) is str:
+            self.extraction_method = sys.intern(self.extraction_method)
+    
+    @property
+    def extracted_at(self) -> datetime:
+        """Extraction time as a datetime (built on demand)."""
+        return datetime.fromtimestamp(self.extracted_at_ns / 1e9)
+    
     def is_valid(self) -> bool:
         """Check if the extracted data contains meaningful information."""
-        return any([
-            self.ean,
-            self.ral_number,
-            self.net_width,
-            self.net_height, 
-            self.net_depth,
-            self.package_units,
-            self.package_weight
-        ])
+        # Short-circuit chain - no temporary list
+        return bool(
+            self.ean
+            or self.ral_number
+            or self.net_width
+            or self.net_height
+            or self.net_depth
+            or self.package_units
+            or self.package_weight
+        )
     
     def get_completeness_score(self) -> float:
         """Calculate how complete the extracted data is (0-1 scale)."""
-        fields = [
-            self.ean, self.ral_number, self.net_width, 
-            self.net_height, self.net_depth, self.package_units, 
-            self.package_weight
-        ]
-        filled_fields = sum(1 for field in fields if field is not None)
-        return filled_fields / len(fields)
+        # Bools add as ints - no list or generator per call
+        filled_fields = (
+            (self.ean is not None)
+            + (self.ral_number is not None)
+            + (self.net_width is not None)
+            + (self.net_height is not None)
+            + (self.net_depth is not None)
+            + (self.package_units is not None)
+            + (self.package_weight is not None)
+        )
+        return filled_fields * _COMPLETENESS_FIELD_WEIGHT
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProductLink:
     """Represents a product link found in Excel data."""
     
@@ -71,16 +99,23 @@ class ProductLink:
     
     def __post_init__(self):
         """Validate and clean the URL."""
-        if self.url:
-            self.url = self.url.strip()
-            if not (self.url.startswith('http://') or self.url.startswith('https://')):
-                if self.url.startswith('www.'):
-                    self.url = f'https://{self.url}'
-                elif '.' in self.url:
-                    self.url = f'https://{self.url}'
+        # Sheet and column names repeat on every link - keep a single copy of each
+        # (only exact str can be interned; None or numeric names are left as they are)
+        if type(self.sheet_name) is str:
+            self.sheet_name = sys.intern(self.sheet_name)
+        if type(self.column_name) is str:
+            self.column_name = sys.intern(self.column_name)
+        
+        url = self.url
+        if url:
+            url = url.strip()
+            # One anchored match instead of two startswith probes; www.* always contains a dot
+            if not _SCHEME_RE.match(url) and '.' in url:
+                url = 'https://' + url
+            self.url = url
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExcelMetadata:
     """Metadata about an Excel file."""
     
@@ -100,7 +135,7 @@ class ExcelData:
     """Represents Excel file data and structure."""
     
     metadata: ExcelMetadata
-    sheets: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    sheets: Dict[str, Optional[pd.DataFrame]] = field(default_factory=dict)  # None unless values were read
     links: List[ProductLink] = field(default_factory=list)
     original_file_path: str = ""
     
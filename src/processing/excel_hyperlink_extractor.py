@@ -1,128 +1,332 @@
 """Extract actual URLs from Excel hyperlink formulas."""
 
+import posixpath
 import re
+import zipfile
+from typing import Dict, Iterator, List, Tuple, Optional
+from xml.etree import ElementTree
+
 import openpyxl
-from typing import List, Tuple, Optional
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+
+# SpreadsheetML namespaces used when reading hyperlinks straight from the package
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_HYPERLINK_TAG = f"{{{_MAIN_NS}}}hyperlink"
+
+# Raw-byte markers for skipping <sheetData> without parsing it (any namespace prefix)
+_ROOT_START_RE = re.compile(rb'<([A-Za-z_][\w.:-]*)[^>]*>')
+_HYPERLINKS_START_RE = re.compile(rb'<(?:[A-Za-z_][\w.-]*:)?hyperlinks[\s>]')
+_HYPERLINKS_END_RE = re.compile(rb'</(?:[A-Za-z_][\w.-]*:)?hyperlinks\s*>')
+_SCAN_CHUNK_SIZE = 1 << 16
+_SCAN_OVERLAP = 64
+
+# HYPERLINK formula parts: the quoted base URL and the trailing cell reference (like C2)
+_URL_RE = re.compile(r'"(https?://[^"]+)"')
+_CELLREF_RE = re.compile(r',\s*([A-Z]+)(\d+)\s*\)')
+
+# Separators ignored when deciding whether a value looks like a product code
+_STRIP_TABLE = str.maketrans('', '', '-_ ')
 
 
 class ExcelHyperlinkExtractor:
     """Extract hyperlinks from Excel files, handling formulas and direct links."""
     
-    def __init__(self, excel_file_path: str):
+    def __init__(self, excel_file_path: str, default_column_name: str = "FISA TEHNICA"):
         self.excel_file_path = excel_file_path
+        self.default_column_name = default_column_name
+        self._default_col_upper = default_column_name.upper()
+        
+        # Opened lazily and shared by every sheet read through this extractor
+        self._wb = None
+        self._sheet_set = frozenset()
+        self._sheet_parts: Optional[Dict[str, str]] = None
         
-    def extract_hyperlinks_from_sheet(self, sheet_name: str, column_name: str = "FISA TEHNICA") -> List[Tuple[int, str, str]]:
+        # Upper-cased header row per sheet and resolved (sheet, column) lookups
+        self._headers_upper: Dict[str, Tuple[str, ...]] = {}
+        self._column_index: Dict[Tuple[str, str], Optional[int]] = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def close(self):
+        """Release the cached workbook handle."""
+        wb = getattr(self, "_wb", None)
+        if wb is not None:
+            self._wb = None
+            wb.close()
+    
+    def _workbook(self):
+        """Return the read-only workbook, loading it on first use."""
+        if self._wb is None:
+            # Read-only mode streams the sheet XML instead of materialising the whole grid
+            self._wb = openpyxl.load_workbook(
+                self.excel_file_path,
+                read_only=True,
+                data_only=False,  # Keep formulas
+                keep_links=False
+            )
+            self._sheet_set = frozenset(self._wb.sheetnames)
+        return self._wb
+    
+    def worksheet_names(self) -> List[str]:
+        """Names of the workbook's worksheets (chartsheets excluded), in workbook order."""
+        return [ws.title for ws in self._workbook().worksheets]
+    
+    def extract_hyperlinks_from_sheet(self, sheet_name: str, column_name: Optional[str] = None) -> List[Tuple[int, str, str]]:
         """
         Extract hyperlinks from a specific sheet and column.
         
         Args:
             sheet_name: Name of the Excel sheet
-            column_name: Name of the column containing hyperlinks
+            column_name: Name of the column containing hyperlinks (defaults to default_column_name)
             
         Returns:
             List of (row_index, display_text, actual_url) tuples
         """
-        hyperlinks = []
+        return list(self.iter_hyperlinks_from_sheet(sheet_name, column_name))
+    
+    def iter_hyperlinks_from_sheet(self, sheet_name: str, column_name: Optional[str] = None) -> Iterator[Tuple[int, str, str]]:
+        """
+        Lazily yield hyperlinks from a specific sheet and column as rows stream past.
+        
+        Args:
+            sheet_name: Name of the Excel sheet
+            column_name: Name of the column containing hyperlinks (defaults to default_column_name)
         
+        Yields:
+            (row_index, display_text, actual_url) tuples
+        """
         try:
-            wb = openpyxl.load_workbook(self.excel_file_path, data_only=False)  # Keep formulas
-            
-            if sheet_name not in wb.sheetnames:
-                return hyperlinks
-                
+            wb = self._workbook()
+            if sheet_name not in self._sheet_set:
+                return
+                    
             sheet = wb[sheet_name]
             
             # Find the column index for the hyperlink column
-            col_index = None
-            for col in range(1, sheet.max_column + 1):
-                header = sheet.cell(row=1, column=col).value
-                if header and column_name.upper() in str(header).upper():
-                    col_index = col
-                    break
-                    
+            target = self._default_col_upper if column_name is None else column_name.upper()
+            col_index = self._find_column(sheet_name, sheet, target)
+            
             if col_index is None:
-                return hyperlinks
+                return
+            
+            # Read-only cells don't carry hyperlinks, so read them from the sheet part
+            direct_links = self._load_direct_hyperlinks(sheet_name, col_index)
                 
-            # Extract hyperlinks from the column
-            for row in range(2, sheet.max_row + 1):  # Skip header row
-                cell = sheet.cell(row=row, column=col_index)
+            # Extract hyperlinks from the column in one pass (skip header row)
+            for row, row_values in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
+                if col_index > len(row_values):
+                    continue
+                value = row_values[col_index - 1]
                 
-                if cell.value:
-                    cell_value = str(cell.value)
+                if value:
+                    cell_value = str(value)
                     
                     # Check if it's a HYPERLINK formula
                     if cell_value.startswith('=HYPERLINK'):
-                        url = self._extract_url_from_hyperlink_formula(cell_value, sheet, row, col_index)
+                        url = self._extract_url_from_hyperlink_formula(cell_value, sheet, row, col_index, row_values)
                         if url:
-                            hyperlinks.append((row - 2, cell_value, url))  # row - 2 for 0-based index
+                            yield (row - 2, cell_value, url)  # row - 2 for 0-based index
                     
                     # Check if cell has direct hyperlink
-                    elif cell.hyperlink:
-                        hyperlinks.append((row - 2, cell_value, cell.hyperlink.target))
-                        
+                    elif row in direct_links:
+                        yield (row - 2, cell_value, direct_links[row])
+                    
                     # Check if it's a product code that should become a URL
                     elif self._is_product_code(cell_value):
                         url = f"https://new.abb.com/products/{cell_value}"
-                        hyperlinks.append((row - 2, cell_value, url))
-                        
-            wb.close()
+                        yield (row - 2, cell_value, url)
             
         except Exception as e:
             print(f"Error extracting hyperlinks from {sheet_name}: {e}")
+    
+    def _find_column(self, sheet_name: str, sheet, target: str) -> Optional[int]:
+        """Return the 1-based index of the first header containing target (already upper-cased)."""
+        key = (sheet_name, target)
+        if key in self._column_index:
+            return self._column_index[key]
+        
+        headers = self._headers_upper.get(sheet_name)
+        if headers is None:
+            # Single header row read; headers are upper-cased once per sheet
+            header_row = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            headers = tuple(str(header).upper() if header else "" for header in header_row)
+            self._headers_upper[sheet_name] = headers
+        
+        col_index = next((col for col, header in enumerate(headers, start=1) if header and target in header), None)
+        self._column_index[key] = col_index
+        return col_index
+    
+    def _load_direct_hyperlinks(self, sheet_name: str, col_index: int) -> Dict[int, Optional[str]]:
+        """
+        Map row number -> hyperlink target for cells in one column.
+        
+        Parses only the workbook/sheet relationship parts and the <hyperlinks>
+        section of the sheet XML; the cell data before it is skipped by
+        _read_hyperlinks_section without being parsed. Cell values are read by
+        the caller's single openpyxl pass, because HYPERLINK formulas and
+        product codes live in the cells, not in the relationships.
+        """
+        links: Dict[int, Optional[str]] = {}
+        
+        with zipfile.ZipFile(self.excel_file_path) as archive:
+            sheet_part = self._sheet_part_map(archive).get(sheet_name)
+            if sheet_part is None:
+                return links
+            
+            part_dir, part_name = posixpath.split(sheet_part)
+            sheet_rels = self._read_relationships(archive, f"{part_dir}/_rels/{part_name}.rels")
             
-        return hyperlinks
+            with archive.open(sheet_part) as sheet_xml:
+                section = self._read_hyperlinks_section(sheet_xml)
+            
+            if section is None:
+                return links
+            
+            for element in ElementTree.fromstring(section).iter(_HYPERLINK_TAG):
+                ref = element.get("ref")
+                if ref:
+                    min_col, min_row, max_col, max_row = range_boundaries(ref)
+                    if min_col <= col_index <= max_col:
+                        target = sheet_rels.get(element.get(f"{{{_REL_NS}}}id"))
+                        for row in range(min_row, max_row + 1):
+                            links[row] = target
+        
+        return links
     
-    def _extract_url_from_hyperlink_formula(self, formula: str, sheet, row: int, col_index: int) -> Optional[str]:
-        """Extract URL from Excel HYPERLINK formula."""
+    @staticmethod
+    def _read_hyperlinks_section(sheet_xml) -> Optional[bytes]:
+        """
+        Return the sheet's <hyperlinks> element wrapped in its root start tag, or None.
+        
+        <hyperlinks> follows <sheetData> in the worksheet schema, and markup inside
+        cell values is always escaped, so the first "<hyperlinks" in the raw bytes is
+        the element itself. The cell data is only decompressed and byte-searched, never
+        parsed; keeping the root start tag keeps its namespace declarations in scope.
+        """
+        data = b""
+        root = None
+        while root is None:
+            chunk = sheet_xml.read(_SCAN_CHUNK_SIZE)
+            if not chunk:
+                return None
+            data += chunk
+            root = _ROOT_START_RE.search(data)
+        
+        root_start, root_name = root.group(0), root.group(1)
+        data = data[root.end():]
+        
+        start = _HYPERLINKS_START_RE.search(data)
+        while start is None:
+            chunk = sheet_xml.read(_SCAN_CHUNK_SIZE)
+            if not chunk:
+                return None
+            # Keep a short tail so a tag split across chunks is still found
+            data = data[-_SCAN_OVERLAP:] + chunk
+            start = _HYPERLINKS_START_RE.search(data)
+        
+        # Only page setup and similar small elements come after <hyperlinks>
+        section = data[start.start():] + sheet_xml.read()
+        end = _HYPERLINKS_END_RE.search(section)
+        if end is None:
+            return None
+        return root_start + section[:end.end()] + b"</" + root_name + b">"
+    
+    def _sheet_part_map(self, archive: zipfile.ZipFile) -> Dict[str, str]:
+        """Map sheet name -> XML part path, parsed once from workbook.xml and its rels."""
+        if self._sheet_parts is None:
+            workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+            workbook_rels = self._read_relationships(archive, "xl/_rels/workbook.xml.rels")
+            parts = {}
+            for sheet in workbook.iter(f"{{{_MAIN_NS}}}sheet"):
+                part = self._resolve_part("xl/", workbook_rels.get(sheet.get(f"{{{_REL_NS}}}id")))
+                if part is not None:
+                    parts[sheet.get("name")] = part
+            self._sheet_parts = parts
+        return self._sheet_parts
+    
+    @staticmethod
+    def _read_relationships(archive: zipfile.ZipFile, rels_path: str) -> Dict[str, str]:
+        """Read a .rels part into an id -> target mapping (empty if missing)."""
+        try:
+            root = ElementTree.fromstring(archive.read(rels_path))
+        except KeyError:
+            return {}
+        return {rel.get("Id"): rel.get("Target") for rel in root}
+    
+    @staticmethod
+    def _resolve_part(base_dir: str, target: Optional[str]) -> Optional[str]:
+        """Resolve a relationship target to a path inside the package."""
+        if not target:
+            return None
+        if target.startswith("/"):
+            return target.lstrip("/")
+        return posixpath.normpath(posixpath.join(base_dir, target))
+    
+    def _extract_url_from_hyperlink_formula(self, formula: str, sheet, row: int, col_index: int, row_values: Optional[tuple] = None) -> Optional[str]:
+        """
+        Extract URL from Excel HYPERLINK formula.
+        
+        row_values holds the current row (as streamed); same-row references are
+        read from it instead of seeking in the read-only sheet.
+        """
         
         # Example: =HYPERLINK(_xlfn.CONCAT("https://new.abb.com/products/",C2),C2)
         
         # First, try to extract base URL from the formula
-        url_match = re.search(r'"(https?://[^"]+)"', formula)
+        url_match = _URL_RE.search(formula)
         if not url_match:
             return None
             
         base_url = url_match.group(1)
         
         # Try to find the cell reference (like C2)
-        cell_ref_match = re.search(r',([A-Z]+\d+)\)', formula)
+        cell_ref_match = _CELLREF_RE.search(formula)
         if cell_ref_match:
-            cell_ref = cell_ref_match.group(1)
-            
             # Convert cell reference to coordinates
             try:
-                ref_col = 0
-                for char in cell_ref:
-                    if char.isalpha():
-                        ref_col = ref_col * 26 + (ord(char.upper()) - ord('A') + 1)
-                    else:
-                        ref_row = int(cell_ref[cell_ref.index(char):])
-                        break
+                ref_col = column_index_from_string(cell_ref_match.group(1))
+                ref_row = int(cell_ref_match.group(2))
                 
                 # Get the value from the referenced cell  
-                ref_cell = sheet.cell(row=ref_row, column=ref_col)
-                if ref_cell.value:
+                ref_value = self._cell_value(sheet, ref_row, ref_col, row, row_values)
+                if ref_value:
                     # Construct final URL
-                    return f"{base_url}{ref_cell.value}"
+                    return f"{base_url}{ref_value}"
                     
             except Exception:
                 pass
                 
         # If we can't parse the reference, try to extract from current row
         # Look for product code in the same row (usually column C)
-        code_cell = sheet.cell(row=row, column=3)  # Column C = index 3
-        if code_cell.value:
-            return f"{base_url}{code_cell.value}"
+        code_value = self._cell_value(sheet, row, 3, row, row_values)  # Column C = index 3
+        if code_value:
+            return f"{base_url}{code_value}"
             
         return base_url  # Return base URL if we can't get the product code
     
+    @staticmethod
+    def _cell_value(sheet, ref_row: int, ref_col: int, row: int, row_values: Optional[tuple]):
+        """Value of a cell, taken from the streamed row when it is on the current row."""
+        if row_values is not None and ref_row == row:
+            return row_values[ref_col - 1] if ref_col <= len(row_values) else None
+        return sheet.cell(row=ref_row, column=ref_col).value
+    
     def _is_product_code(self, value: str) -> bool:
         """Check if a value looks like a product code."""
-        if not isinstance(value, str) or len(value) < 5:
+        # Fast reject - long descriptive text can't be a code even after stripping
+        if not isinstance(value, str) or len(value) < 5 or len(value) > 60:
             return False
             
-        # Remove common separators
-        clean_value = value.replace('-', '').replace('_', '').replace(' ', '')
+        # Remove common separators in a single pass
+        clean_value = value.translate(_STRIP_TABLE)
         
         # Should be alphanumeric and reasonable length
         return clean_value.isalnum() and 5 <= len(clean_value) <= 50
\ No newline at end of file
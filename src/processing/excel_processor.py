@@ -1,19 +1,57 @@
 """Core Excel file processing functionality."""
 
+import functools
 import os
+import re
+from collections import defaultdict
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import openpyxl
-from openpyxl.styles import NamedStyle
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+# Rust-based reader used by pandas' "calamine" engine; openpyxl is the fallback
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
 from models.product_data import ExcelData, ExcelMetadata, ProductLink
 from models.processing_result import ProcessingResult, ProcessingStatus
 from utils.logger import get_logger
+from utils.validators import validate_url
 from .excel_hyperlink_extractor import ExcelHyperlinkExtractor
 
+# validate_url is pure, so identical hyperlinks (placeholders, repeated SKUs) validate once
+_cached_validate_url = functools.lru_cache(maxsize=4096)(validate_url)
+
+# Column names that usually hold product links
+_LINK_INDICATOR_RE = re.compile('|'.join(map(re.escape, [
+    'fisa technica', 'fisa_technica', 'fisatechnica',
+    'link', 'url', 'website', 'web', 'href',
+    'technical sheet', 'datasheet', 'spec sheet'
+])))
+
+# URL-like value: longer than 5 chars and a scheme, www. prefix or a 2+ char last dot segment
+# (the regex serves the vectorised column check, the prefixes the scalar one)
+_URL_LIKE_RE = re.compile(r'(?=.{6})(?:https?://|www\.|.*\.[^.]{2,}\Z)', re.DOTALL)
+_URL_PREFIXES = ('http://', 'https://', 'www.')
+
+# ProductData fields behind the results-only columns, read in one C-level call per record
+_read_result_fields = attrgetter(
+    'ean', 'ral_number', 'net_width', 'net_height', 'net_depth', 'package_units', 'package_weight'
+)
+_EMPTY_RESULT_FIELDS = ('',) * 7
+
+# Upper bound on concurrent per-sheet readers for the openpyxl fallback
+MAX_SHEET_READERS = 8
+
 
 class ExcelProcessor:
     """Handles Excel file reading, processing, and writing operations."""
@@ -21,12 +59,15 @@ class ExcelProcessor:
     def __init__(self):
         self.logger = get_logger(__name__)
     
-    def read_excel_file(self, file_path: str) -> ExcelData:
+    def read_excel_file(self, file_path: str, read_values: bool = False) -> ExcelData:
         """
         Read an Excel file and extract all relevant data.
         
         Args:
             file_path: Path to the Excel file
+            read_values: Load every sheet into a DataFrame. Links come from the
+                hyperlink extractor, so by default only sheet names and sizes are
+                read and ExcelData.sheets maps each name to None.
             
         Returns:
             ExcelData object containing all sheets and metadata
@@ -37,12 +78,14 @@ class ExcelProcessor:
         """
         self.logger.info(f"Reading Excel file: {file_path}")
         
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Excel file not found: {file_path}")
+        # One stat call both checks existence and provides the metadata
+        try:
+            file_stats = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Excel file not found: {file_path}") from None
         
         try:
             # Get file metadata
-            file_stats = os.stat(file_path)
             metadata = ExcelMetadata(
                 filename=os.path.basename(file_path),
                 file_path=file_path,
@@ -51,34 +94,30 @@ class ExcelProcessor:
                 modified_at=datetime.fromtimestamp(file_stats.st_mtime)
             )
             
-            # Read all sheets from the Excel file
-            with pd.ExcelFile(file_path) as excel_file:
-                sheet_names = excel_file.sheet_names
-                metadata.sheet_names = sheet_names
-                
-                sheets = {}
-                total_rows = 0
-                total_columns = 0
-                
-                for sheet_name in sheet_names:
-                    self.logger.debug(f"Reading sheet: {sheet_name}")
-                    
-                    # Read sheet with proper handling of various data types
-                    df = pd.read_excel(
-                        excel_file,
-                        sheet_name=sheet_name,
-                        engine='openpyxl',
-                        dtype=str,  # Read everything as string initially to preserve data
-                        na_values=[''],
-                        keep_default_na=False
-                    )
-                    
-                    sheets[sheet_name] = df
-                    total_rows += len(df)
-                    total_columns = max(total_columns, len(df.columns))
+            shapes = None
+            if not read_values:
+                try:
+                    dimensions = self._read_sheet_dimensions(file_path)
+                    sheets = dict.fromkeys(dimensions)
+                    shapes = list(dimensions.values())
+                except Exception as e:
+                    # e.g. legacy .xls, which openpyxl can't open - pandas can
+                    self.logger.debug("Sheet dimensions unavailable, reading values: %s", e)
+            
+            if shapes is None:
+                # Read all sheets from the Excel file
+                sheets = self._read_sheets(file_path)
                 
-                metadata.total_rows = total_rows
-                metadata.total_columns = total_columns
+                # Totals come from each frame's shape after the read - no running counters in a read loop
+                shapes = [df.shape for df in sheets.values()]
+            
+            sheet_names = list(sheets)
+            metadata.sheet_names = sheet_names
+            
+            total_rows = sum(rows for rows, _ in shapes)
+            total_columns = max((columns for _, columns in shapes), default=0)
+            metadata.total_rows = total_rows
+            metadata.total_columns = total_columns
             
             # Create ExcelData object
             excel_data = ExcelData(
@@ -96,6 +135,69 @@ class ExcelProcessor:
             self.logger.error(f"Failed to read Excel file {file_path}: {str(e)}")
             raise ValueError(f"Invalid Excel file or read error: {str(e)}")
     
+    @staticmethod
+    def _read_sheet_dimensions(file_path: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Map sheet name -> (data rows, columns) without loading any cell values.
+        
+        Read-only worksheets take their size from the sheet's <dimension> element.
+        """
+        wb = openpyxl.load_workbook(file_path, read_only=True, keep_links=False)
+        try:
+            # Row 1 is the header, matching the DataFrame row count
+            return {
+                ws.title: (max((ws.max_row or 1) - 1, 0), ws.max_column or 0)
+                for ws in wb.worksheets
+            }
+        finally:
+            wb.close()
+    
+    def _read_sheets(self, file_path: str) -> Dict[str, pd.DataFrame]:
+        """Read every sheet as strings, preferring the calamine engine when installed."""
+        if CALAMINE_AVAILABLE:
+            try:
+                # One pass over the workbook in compiled code - returns {sheet_name: DataFrame}
+                return pd.read_excel(
+                    file_path,
+                    sheet_name=None,
+                    engine='calamine',
+                    dtype=str,  # Read everything as string initially to preserve data
+                    na_values=[''],
+                    keep_default_na=False
+                )
+            except (ImportError, ValueError) as e:
+                # pandas < 2.2 doesn't know the engine
+                self.logger.debug("Calamine engine unavailable, falling back to openpyxl: %s", e)
+        
+        with pd.ExcelFile(file_path) as excel_file:
+            sheet_names = excel_file.sheet_names
+            if len(sheet_names) <= 1:
+                return {name: self._read_sheet(excel_file, name) for name in sheet_names}
+        
+        # Each worker opens its own ExcelFile so sheets parse (and unzip) concurrently;
+        # map() yields in submission order, keeping the workbook's sheet order
+        def read_one(sheet_name: str) -> pd.DataFrame:
+            with pd.ExcelFile(file_path) as worker_file:
+                return self._read_sheet(worker_file, sheet_name)
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_SHEET_READERS, len(sheet_names)),
+                                thread_name_prefix="sheet") as executor:
+            return dict(zip(sheet_names, executor.map(read_one, sheet_names)))
+    
+    def _read_sheet(self, excel_file: pd.ExcelFile, sheet_name: str) -> pd.DataFrame:
+        """Read one sheet through openpyxl with every value as a string."""
+        self.logger.debug(f"Reading sheet: {sheet_name}")
+        
+        # Read sheet with proper handling of various data types
+        return pd.read_excel(
+            excel_file,
+            sheet_name=sheet_name,
+            engine='openpyxl',
+            dtype=str,  # Read everything as string initially to preserve data
+            na_values=[''],
+            keep_default_na=False
+        )
+    
     def extract_links(self, excel_data: ExcelData) -> List[ProductLink]:
         """
         Extract product links from Excel data using hyperlink extractor.
@@ -103,6 +205,24 @@ class ExcelProcessor:
         Args:
             excel_data: ExcelData object containing sheet data
             
+        Returns:
+            List of ProductLink objects found in the Excel sheets
+        """
+        links = self.extract_links_from_file(excel_data.original_file_path, list(excel_data.sheets))
+        excel_data.links = links
+        excel_data.metadata.links_found = len(links)
+        return links
+    
+    def extract_links_from_file(self, file_path: str, sheet_names: Optional[List[str]] = None) -> List[ProductLink]:
+        """
+        Extract product links straight from the workbook file.
+        
+        Needs no ExcelData, so it can run alongside read_excel_file.
+        
+        Args:
+            file_path: Path to the Excel file
+            sheet_names: Sheets to scan (defaults to every worksheet in the workbook)
+        
         Returns:
             List of ProductLink objects found in the Excel sheets
         """
@@ -113,61 +233,65 @@ class ExcelProcessor:
         total_items_processed = 0
         
         # Use hyperlink extractor to get real URLs
-        extractor = ExcelHyperlinkExtractor(excel_data.original_file_path)
-        
-        self.logger.info(f"🔗 Starting full extraction from {len(excel_data.sheets)} sheets")
+        extractor = ExcelHyperlinkExtractor(file_path)
         
-        for sheet_index, sheet_name in enumerate(excel_data.sheets.keys(), 1):
-            self.logger.info(f"📊 Processing sheet {sheet_index}/{len(excel_data.sheets)}: {sheet_name}")
+        # One workbook handle serves every sheet; release it once extraction is done
+        try:
+            if sheet_names is None:
+                try:
+                    sheet_names = extractor.worksheet_names()
+                except Exception as e:
+                    self.logger.warning(f"Cannot list worksheets in {file_path}: {e}")
+                    sheet_names = []
             
-            # Extract hyperlinks from this sheet
-            sheet_hyperlinks = extractor.extract_hyperlinks_from_sheet(sheet_name, "FISA TEHNICA")
-            self.logger.info(f"  Found {len(sheet_hyperlinks)} hyperlinks in {sheet_name}")
+            self.logger.info(f"🔗 Starting full extraction from {len(sheet_names)} sheets")
             
-            sheet_processed = 0
-            for row_index, display_text, actual_url in sheet_hyperlinks:
-                total_items_processed += 1
-                sheet_processed += 1
-                self.logger.debug(f"Found hyperlink: {display_text} -> {actual_url}")
+            for sheet_index, sheet_name in enumerate(sheet_names, 1):
+                self.logger.info(f"📊 Processing sheet {sheet_index}/{len(sheet_names)}: {sheet_name}")
                 
-                # Validate the extracted URL
-                from utils.validators import validate_url
-                is_valid, error_msg = validate_url(actual_url)
+                # Stream hyperlinks from this sheet - rows are validated as they are parsed
+                sheet_hyperlinks = extractor.iter_hyperlinks_from_sheet(sheet_name, "FISA TEHNICA")
                 
-                if is_valid:
-                    # Use the validated URL
-                    cleaned_url = error_msg if error_msg else actual_url
-                    link = ProductLink(
-                        url=cleaned_url,
-                        row_index=row_index,
-                        sheet_name=sheet_name,
-                        column_name="FISA TEHNICA"
-                    )
-                    links.append(link)
-                else:
-                    # Log skipped entries
-                    skipped_entries.append({
-                        'value': display_text,
-                        'sheet': sheet_name,
-                        'row': row_index + 2,  # +2 for Excel row numbering
-                        'reason': error_msg,
-                        'extracted_url': actual_url
-                    })
-        
-        excel_data.links = links
-        excel_data.metadata.links_found = len(links)
+                sheet_processed = 0
+                for row_index, display_text, actual_url in sheet_hyperlinks:
+                    total_items_processed += 1
+                    sheet_processed += 1
+                    self.logger.debug(f"Found hyperlink: {display_text} -> {actual_url}")
+                    
+                    # Validate the extracted URL (repeated URLs are answered from the cache)
+                    is_valid, error_msg = _cached_validate_url(actual_url)
+                    
+                    if is_valid:
+                        # Use the validated URL
+                        cleaned_url = error_msg if error_msg else actual_url
+                        link = ProductLink(
+                            url=cleaned_url,
+                            row_index=row_index,
+                            sheet_name=sheet_name,
+                            column_name="FISA TEHNICA"
+                        )
+                        links.append(link)
+                    else:
+                        # Log skipped entries
+                        skipped_entries.append({
+                            'value': display_text,
+                            'sheet': sheet_name,
+                            'row': row_index + 2,  # +2 for Excel row numbering
+                            'reason': error_msg,
+                            'extracted_url': actual_url
+                        })
+                
+                self.logger.info(f"  Found {sheet_processed} hyperlinks in {sheet_name}")
+        finally:
+            extractor.close()
         
         # Log summary of processing
         self.logger.info(f"✅ FULL PROCESSING: Processed {total_items_processed} total items from all sheets")
         self.logger.info(f"🔗 Extracted {len(links)} valid product links using hyperlink extractor")
         
         # Log per-sheet summary
-        sheet_counts = {}
-        for link in links:
-            sheet_counts[link.sheet_name] = sheet_counts.get(link.sheet_name, 0) + 1
-        
-        for sheet_name, count in sheet_counts.items():
-            self.logger.info(f"  📊 {sheet_name}: {count} links")
+        for sheet_name, sheet_links in self._group_links_by_sheet(links).items():
+            self.logger.info(f"  📊 {sheet_name}: {len(sheet_links)} links")
             
         if skipped_entries:
             self.logger.info(f"Skipped {len(skipped_entries)} invalid entries:")
@@ -178,22 +302,30 @@ class ExcelProcessor:
         
         return links
     
+    @staticmethod
+    def _group_links_by_sheet(links: List[ProductLink]) -> Dict[str, List[ProductLink]]:
+        """Group links by sheet name in one pass, keeping their original order."""
+        links_by_sheet: Dict[str, List[ProductLink]] = defaultdict(list)
+        for link in links:
+            links_by_sheet[link.sheet_name].append(link)
+        return links_by_sheet
+    
+    @staticmethod
+    def _header_cell(ws, value: str, font: Font) -> WriteOnlyCell:
+        """Build a styled header cell for a write-only sheet."""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = font
+        return cell
+    
     def _find_link_columns(self, df: pd.DataFrame) -> List[str]:
         """Find columns that likely contain web links."""
         link_columns = []
         
-        # Common column names that might contain links
-        link_indicators = [
-            'fisa technica', 'fisa_technica', 'fisatechnica',
-            'link', 'url', 'website', 'web', 'href',
-            'technical sheet', 'datasheet', 'spec sheet'
-        ]
-        
         for column in df.columns:
             column_lower = str(column).lower()
             
-            # Check if column name matches known link indicators
-            if any(indicator in column_lower for indicator in link_indicators):
+            # Check if column name matches known link indicators (one precompiled alternation)
+            if _LINK_INDICATOR_RE.search(column_lower):
                 link_columns.append(column)
                 continue
             
@@ -205,32 +337,21 @@ class ExcelProcessor:
     
     def _column_contains_urls(self, series: pd.Series) -> bool:
         """Check if a pandas Series contains URL-like values."""
-        sample_size = min(10, len(series))
-        sample_values = series.dropna().head(sample_size)
-        
-        url_count = 0
-        for value in sample_values:
-            if self._is_valid_url(str(value)):
-                url_count += 1
+        sample_values = series.dropna().head(10)
+        if sample_values.empty:
+            return False
         
-        # If more than 30% of sample values are URLs, consider it a link column
-        return (url_count / len(sample_values)) > 0.3 if len(sample_values) > 0 else False
+        # Vectorised match over the sample; more than 30% URLs makes it a link column
+        return sample_values.astype(str).str.strip().str.match(_URL_LIKE_RE).mean() > 0.3
     
     def _is_valid_url(self, url: str) -> bool:
         """Basic URL validation."""
         url = url.strip()
-        if not url:
-            return False
-        
-        # Check for common URL patterns
-        url_patterns = [
-            url.startswith('http://'),
-            url.startswith('https://'),
-            url.startswith('www.'),
-            ('.' in url and len(url.split('.')[-1]) >= 2)  # Basic domain check
-        ]
-        
-        return any(url_patterns) and len(url) > 5
+        # Short-circuit: C-level tuple prefix check first, dot-segment check only if needed
+        return len(url) > 5 and (
+            url.startswith(_URL_PREFIXES)
+            or ('.' in url and len(url.rsplit('.', 1)[-1]) >= 2)  # Basic domain check
+        )
     
     def write_enhanced_excel(self, excel_data: ExcelData, output_path: str, 
                            preserve_formatting: bool = False) -> str:
@@ -253,24 +374,19 @@ class ExcelProcessor:
             if output_dir:  # Only create directory if path has a directory component
                 os.makedirs(output_dir, exist_ok=True)
             
-            if preserve_formatting and self._can_preserve_formatting(excel_data.original_file_path):
-                return self._write_with_formatting(excel_data, output_path)
-            else:
-                return self._write_without_formatting(excel_data, output_path)
+            if preserve_formatting:
+                # Load the original once; if openpyxl can't handle it, fall back to results-only
+                try:
+                    return self._write_with_formatting(excel_data, output_path)
+                except Exception as e:
+                    self.logger.warning(f"Cannot preserve formatting, writing results-only file: {e}")
+            
+            return self._write_without_formatting(excel_data, output_path)
                 
         except Exception as e:
             self.logger.error(f"Failed to write enhanced Excel file: {str(e)}")
             raise
     
-    def _can_preserve_formatting(self, original_path: str) -> bool:
-        """Check if we can preserve the original formatting."""
-        try:
-            # Try to open with openpyxl to see if it's compatible
-            openpyxl.load_workbook(original_path)
-            return True
-        except:
-            return False
-    
     def _write_with_formatting(self, excel_data: ExcelData, output_path: str) -> str:
         """Write Excel file while preserving original formatting."""
         # Load the original workbook to preserve formatting
@@ -289,28 +405,34 @@ class ExcelProcessor:
             'Extraction Method': 'extraction_method'
         }
         
+        # Read every new field of a record in one C-level call
+        read_fields = attrgetter(*new_columns.values())
+        
+        # One pass over the links instead of a filtered scan per sheet
+        links_by_sheet = self._group_links_by_sheet(excel_data.links)
+        
         # Process each sheet
         for sheet_name in wb.sheetnames:
             if sheet_name in excel_data.sheets:
                 ws = wb[sheet_name]
                 
                 # Find the rightmost column to add new data
-                max_col = ws.max_column
+                first_new = ws.max_column + 1
+                target_columns = range(first_new, first_new + len(new_columns))
                 
                 # Add headers for new columns
                 header_row = 1  # Assuming first row contains headers
-                for i, (header, _) in enumerate(new_columns.items()):
-                    ws.cell(row=header_row, column=max_col + i + 1, value=header)
+                for column, header in zip(target_columns, new_columns):
+                    ws.cell(row=header_row, column=column, value=header)
                 
-                # Add extracted data
-                for link in excel_data.get_links_by_sheet(sheet_name):
+                # Add extracted data - only non-empty values get a cell
+                for link in links_by_sheet.get(sheet_name, ()):
                     if link.extracted_data:
                         row_num = link.row_index + 2  # +2 because pandas is 0-indexed and we have headers
                         
-                        for i, (_, field_name) in enumerate(new_columns.items()):
-                            value = getattr(link.extracted_data, field_name, '')
+                        for column, value in zip(target_columns, read_fields(link.extracted_data)):
                             if value is not None:
-                                ws.cell(row=row_num, column=max_col + i + 1, value=value)
+                                ws.cell(row=row_num, column=column, value=value)
         
         # Save the enhanced workbook
         wb.save(output_path)
@@ -325,73 +447,56 @@ class ExcelProcessor:
         total_links_with_data = 0
         total_links_without_data = 0
         
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            for sheet_name, df in excel_data.sheets.items():
+        # One pass over the links instead of a filtered scan per sheet
+        links_by_sheet = self._group_links_by_sheet(excel_data.links)
+        
+        # Output holds ONLY the extracted columns (NO original data)
+        new_columns = [
+            'Product Code',
+            'EAN Code',
+            'RAL Number',
+            'Net Width (mm)',
+            'Net Height (mm)',
+            'Net Depth (mm)',
+            'Package Units',
+            'Package Weight (kg)'
+        ]
+        
+        # Write-only workbook: rows are serialised as they are appended, no cell tree in memory
+        wb = openpyxl.Workbook(write_only=True)
+        header_font = Font(bold=True)
+        
+        try:
+            for sheet_name in excel_data.sheets:
                 self.logger.info(f"🔍 Processing sheet: {sheet_name}")
                 
-                # Create new dataframe with ONLY the extracted columns (NO original data)
-                new_columns = [
-                    'Product Code',
-                    'EAN Code', 
-                    'RAL Number',
-                    'Net Width (mm)',
-                    'Net Height (mm)', 
-                    'Net Depth (mm)',
-                    'Package Units',
-                    'Package Weight (kg)'
-                ]
-                
-                # Create empty dataframe with new structure
-                result_data = []
+                ws = wb.create_sheet(sheet_name)
+                ws.append([self._header_cell(ws, header, header_font) for header in new_columns])
                 
                 # Get sheet links and create rows only for products that had links
-                sheet_links = excel_data.get_links_by_sheet(sheet_name)
+                sheet_links = links_by_sheet.get(sheet_name, [])
                 self.logger.info(f"📋 Found {len(sheet_links)} product links in {sheet_name}")
                 
-                for i, link in enumerate(sheet_links):
+                # Rows stream straight into the write-only sheet - no per-column staging lists
+                for link in sheet_links:
                     product_code = link.url.split('/')[-1] if '/' in link.url else link.url
                     
-                    row_data = {
-                        'Product Code': product_code,
-                        'EAN Code': '',
-                        'RAL Number': '', 
-                        'Net Width (mm)': '',
-                        'Net Height (mm)': '',
-                        'Net Depth (mm)': '',
-                        'Package Units': '',
-                        'Package Weight (kg)': ''
-                    }
-                    
                     # Fill in extracted data if available
-                    if link.extracted_data:
+                    data = link.extracted_data
+                    if data:
                         total_links_with_data += 1
-                        data = link.extracted_data
-                        row_data.update({
-                            'EAN Code': data.ean or '',
-                            'RAL Number': data.ral_number or '',
-                            'Net Width (mm)': data.net_width or '',
-                            'Net Height (mm)': data.net_height or '',
-                            'Net Depth (mm)': data.net_depth or '',
-                            'Package Units': data.package_units or '',
-                            'Package Weight (kg)': data.package_weight or ''
-                        })
+                        ws.append((product_code, *[value or '' for value in _read_result_fields(data)]))
                         self.logger.debug(f"✅ Product {product_code}: Has extracted data")
                     else:
                         total_links_without_data += 1
+                        ws.append((product_code, *_EMPTY_RESULT_FIELDS))
                         self.logger.debug(f"❌ Product {product_code}: No extracted data (web scraping needed)")
-                    
-                    result_data.append(row_data)
                 
-                # Create dataframe with only new columns
-                if result_data:
-                    enhanced_df = pd.DataFrame(result_data)
-                else:
-                    # If no links found, create empty dataframe with column structure
-                    enhanced_df = pd.DataFrame(columns=new_columns)
-                
-                # Write the results-only dataframe to Excel
-                enhanced_df.to_excel(writer, sheet_name=sheet_name, index=False)
-                self.logger.info(f"📄 Sheet {sheet_name}: {len(result_data)} rows written with ONLY new columns")
+                self.logger.info(f"📄 Sheet {sheet_name}: {len(sheet_links)} rows written with ONLY new columns")
+            
+            wb.save(output_path)
+        finally:
+            wb.close()
         
         self.logger.info(f"📊 SUMMARY:")
         self.logger.info(f"   📝 Results-only Excel file saved: {output_path}")
@@ -4,7 +4,6 @@ import asyncio
 import os
 from pathlib import Path
 from typing import List, Optional, Callable
-from datetime import datetime
 
 from models.product_data import ExcelData, ProductLink
 from models.processing_result import ProcessingResult, ProcessingStatus
@@ -14,6 +13,17 @@ from scraping.scraping_engine import ScrapingEngine
 from utils.logger import get_logger
 
 
+def _as_async_callback(callback: Optional[Callable]) -> Optional[Callable]:
+    """Return callback as a coroutine function (None stays None), wrapping sync callables once."""
+    if callback is None or asyncio.iscoroutinefunction(callback):
+        return callback
+    
+    async def call_sync(*args):
+        callback(*args)
+    
+    return call_sync
+
+
 class IntegrationProcessor:
     """Main processor that integrates Excel processing and web scraping."""
     
@@ -37,6 +47,9 @@ class IntegrationProcessor:
             azure_api_key
         )
         
+        # The scraping engine runs one link batch at a time; created on first use inside the loop
+        self._scraping_lock: Optional[asyncio.Lock] = None
+        
         self.logger.info("Integration processor initialized")
     
     async def process_excel_file(
@@ -58,31 +71,36 @@ class IntegrationProcessor:
         """
         result = ProcessingResult(
             file_path=file_path,
-            status=ProcessingStatus.IN_PROGRESS,
-            started_at=datetime.now()
+            status=ProcessingStatus.IN_PROGRESS
         )
         
+        # Blocking workbook I/O runs in the loop's executor so the loop stays responsive
+        loop = asyncio.get_running_loop()
+        
+        # Sync/async is decided once here, not on every progress update
+        report = _as_async_callback(progress_callback)
+        file_name = os.path.basename(file_path)
+        
         try:
             self.logger.info(f"Starting to process Excel file: {file_path}")
             
-            # Step 1: Read Excel file
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback(f"Reading Excel file: {os.path.basename(file_path)}", 0.1, 1, 1)
-                else:
-                    progress_callback(f"Reading Excel file: {os.path.basename(file_path)}", 0.1, 1, 1)
+            # Step 1: Read Excel file and extract links - two independent passes over the
+            # same package, run side by side on the executor
+            if report:
+                await report(f"Reading Excel file: {file_name}", 0.1, 1, 1)
             
-            excel_data = self.excel_processor.read_excel_file(file_path)
+            excel_data, links = await asyncio.gather(
+                loop.run_in_executor(None, self.excel_processor.read_excel_file, file_path),
+                loop.run_in_executor(None, self.excel_processor.extract_links_from_file, file_path)
+            )
+            excel_data.links = links
+            excel_data.metadata.links_found = len(links)
             self.logger.info(f"Read Excel file with {len(excel_data.sheets)} sheets")
             
-            # Step 2: Extract links
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback("Extracting product links...", 0.2, 1, 1)
-                else:
-                    progress_callback("Extracting product links...", 0.2, 1, 1)
+            # Step 2: Links are ready
+            if report:
+                await report(f"Extracted {len(links)} product links", 0.2, 1, 1)
             
-            links = self.excel_processor.extract_links(excel_data)
             result.total_links = len(links)
             
             self.logger.info(f"Extracted {len(links)} product links")
@@ -92,30 +110,31 @@ class IntegrationProcessor:
                 self.logger.warning("No links found to process")
             else:
                 # Step 3: Process web scraping
-                if progress_callback:
-                    if asyncio.iscoroutinefunction(progress_callback):
-                        await progress_callback("Starting web scraping...", 0.3, 1, 1)
-                    else:
-                        progress_callback("Starting web scraping...", 0.3, 1, 1)
+                if report:
+                    await report("Starting web scraping...", 0.3, 1, 1)
                 
-                scraping_results = await self.scraping_engine.process_links(
-                    links,
-                    progress_callback=self._create_scraping_progress_callback(progress_callback),
-                    result_callback=lambda sr: result.add_scraping_result(sr)
-                )
+                if self._scraping_lock is None:
+                    self._scraping_lock = asyncio.Lock()
+                
+                # Other files keep reading/writing while this one holds the engine
+                async with self._scraping_lock:
+                    scraping_results = await self.scraping_engine.process_links(
+                        links,
+                        progress_callback=self._create_scraping_progress_callback(report),
+                        result_callback=lambda sr: result.add_scraping_result(sr)
+                    )
                 
                 self.logger.info(f"Completed web scraping: {len(scraping_results)} results")
             
             # Step 4: Generate output file
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback("Generating output file...", 0.9, 1, 1)
-                else:
-                    progress_callback("Generating output file...", 0.9, 1, 1)
+            if report:
+                await report("Generating output file...", 0.9, 1, 1)
             
             output_path = self._generate_output_path(file_path, output_directory)
             
-            enhanced_file = self.excel_processor.write_enhanced_excel(
+            enhanced_file = await loop.run_in_executor(
+                None,
+                self.excel_processor.write_enhanced_excel,
                 excel_data,
                 output_path,
                 self.config.output.preserve_formatting
@@ -126,11 +145,8 @@ class IntegrationProcessor:
             # Step 5: Complete processing
             result.mark_completed()
             
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback("Processing completed", 1.0, 1, 1)
-                else:
-                    progress_callback("Processing completed", 1.0, 1, 1)
+            if report:
+                await report("Processing completed", 1.0, 1, 1)
             
             self.logger.info(f"Successfully processed Excel file: {file_path}")
             
@@ -141,11 +157,8 @@ class IntegrationProcessor:
             self.logger.error(error_msg)
             result.mark_failed(error_msg)
             
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback(f"Processing failed: {str(e)}", 0.0, 1, 1)
-                else:
-                    progress_callback(f"Processing failed: {str(e)}", 0.0, 1, 1)
+            if report:
+                await report(f"Processing failed: {str(e)}", 0.0, 1, 1)
             
             return result
     
@@ -168,70 +181,76 @@ class IntegrationProcessor:
         """
         self.logger.info(f"Starting to process {len(file_paths)} Excel files")
         
-        results = []
         total_files = len(file_paths)
+        report = _as_async_callback(progress_callback)
         
-        for i, file_path in enumerate(file_paths):
-            current_file = i + 1
-            
-            try:
-                # Create progress callback for single file
-                single_file_progress = None
-                if progress_callback:
-                    async def single_file_progress(message: str, progress: float, cf: int, tf: int):
-                        if asyncio.iscoroutinefunction(progress_callback):
-                            await progress_callback(message, progress, current_file, total_files)
-                        else:
-                            progress_callback(message, progress, current_file, total_files)
-                
-                # Process single file
+        # Files overlap their Excel I/O; scraping itself is serialised by _scraping_lock
+        semaphore = asyncio.Semaphore(max(1, self.config.scraping.max_concurrent_files))
+        
+        async def process_one(current_file: int, file_path: str) -> ProcessingResult:
+            async with semaphore:
                 result = await self.process_excel_file(
                     file_path,
                     output_directory,
-                    single_file_progress
+                    self._file_progress_callback(report, current_file, total_files)
                 )
-                
-                results.append(result)
-                
                 self.logger.info(f"Completed file {current_file}/{total_files}: {os.path.basename(file_path)}")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to process file {file_path}: {str(e)}")
+                return result
+        
+        outcomes = await asyncio.gather(
+            *(process_one(i, file_path) for i, file_path in enumerate(file_paths, start=1)),
+            return_exceptions=True
+        )
+        
+        results = []
+        for file_path, outcome in zip(file_paths, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Failed to process file {file_path}: {str(outcome)}")
                 
                 # Create failed result
                 failed_result = ProcessingResult(
                     file_path=file_path,
                     status=ProcessingStatus.FAILED
                 )
-                failed_result.mark_failed(str(e))
+                failed_result.mark_failed(str(outcome))
                 results.append(failed_result)
+            else:
+                results.append(outcome)
         
         self.logger.info(f"Completed processing {len(file_paths)} files")
         return results
     
+    @staticmethod
+    def _file_progress_callback(report: Optional[Callable], current_file: int, total_files: int) -> Optional[Callable]:
+        """Bind one file's position into the multi-file progress callback."""
+        if report is None:
+            return None
+        
+        async def single_file_progress(message: str, progress: float, cf: int, tf: int):
+            await report(message, progress, current_file, total_files)
+        
+        return single_file_progress
+    
     def _create_scraping_progress_callback(self, main_progress_callback):
         """Create a progress callback for scraping that maps to main progress."""
         if not main_progress_callback:
             return None
         
+        report = _as_async_callback(main_progress_callback)
+        
         async def scraping_progress(processed: int, total: int, current_url: str):
             if total > 0:
                 scraping_progress_pct = processed / total
                 # Map scraping progress to 30%-80% of total progress
                 overall_progress = 0.3 + (scraping_progress_pct * 0.5)
                 
-                if asyncio.iscoroutinefunction(main_progress_callback):
-                    await main_progress_callback(
-                        f"Scraping {processed}/{total}: {os.path.basename(current_url)}",
-                        overall_progress,
-                        1, 1  # current_file and total_files for single file processing
-                    )
-                else:
-                    main_progress_callback(
-                        f"Scraping {processed}/{total}: {os.path.basename(current_url)}",
-                        overall_progress,
-                        1, 1  # current_file and total_files for single file processing
-                    )
+                # Last URL segment - a plain string split, URLs aren't filesystem paths
+                name = current_url.rsplit('/', 1)[-1]
+                await report(
+                    f"Scraping {processed}/{total}: {name}",
+                    overall_progress,
+                    1, 1  # current_file and total_files for single file processing
+                )
         
         return scraping_progress
     
@@ -262,6 +281,16 @@ class IntegrationProcessor:
         from utils.validators import validate_excel_file
         return validate_excel_file(file_path)
     
+    async def aclose(self):
+        """Release network resources held by the scraping engine."""
+        await self.scraping_engine.aclose()
+    
+    async def __aenter__(self) -> "IntegrationProcessor":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     async def test_scraping(self, url: str):
         """Test scraping a single URL for debugging."""
         return await self.scraping_engine.test_single_url(url)
@@ -3,9 +3,11 @@
 import asyncio
 import aiohttp
 import random
-from typing import List, Optional, Dict, Callable, Any
+from typing import List, Optional, Dict, Callable, Any, Tuple, Awaitable
 from datetime import datetime
+from urllib.parse import urlsplit
 import time
+from collections import OrderedDict
 
 from models.product_data import ProductLink, ProductData
 from models.processing_result import ScrapingResult, ProcessingStatus
@@ -14,6 +16,16 @@ from .strategy_manager import StrategyManager
 from utils.logger import get_logger, ProgressLogger, AdvancedProgressTracker
 from utils.cache_manager import CacheManager, MemoryCache
 
+# Progress updates are coalesced: flushed after a batch of completions or this many seconds
+PROGRESS_FLUSH_INTERVAL = 0.1
+PROGRESS_BATCH_MAX = 16
+
+# Bound on the negative cache of URLs known to be in neither cache
+RECENT_MISSES_MAX = 4096
+
+# Disk cache writes are queued and persisted by one background writer, a batch at a time
+DISK_WRITE_QUEUE_SIZE = 1024
+DISK_WRITE_BATCH = 32
 
 class ScrapingEngine:
     """Main engine for web scraping with concurrent processing."""
@@ -27,20 +39,36 @@ class ScrapingEngine:
         
         # Initialize caching systems
         self.disk_cache = CacheManager(cache_dir="cache/scraping", max_age_hours=24)
-        self.memory_cache = MemoryCache(max_size=1000)  # Cache for frequently accessed URLs
+        self.memory_cache = MemoryCache(max_size=1000, ttl_seconds=300)  # Cache for frequently accessed URLs (5 minutes)
+        
+        # URLs recently missing from both caches, so repeat lookups skip the disk probe
+        self._recent_misses: "OrderedDict[str, None]" = OrderedDict()
+        
+        # HTTP session shared by every call; bound to the loop it was created in
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Set while process_links runs its background disk writer
+        self._disk_write_queue: Optional[asyncio.Queue] = None
         
         # Processing state
         self.is_processing = False
         self.processed_count = 0
         self.total_count = 0
         
+        # Completions not yet reported to the progress tracker/callback
+        self._pending_successes = 0
+        self._pending_failures = 0
+        self._last_progress_flush = 0.0
+        
         # Cache statistics
         self.cache_hits = 0
         self.cache_misses = 0
         
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0 / config.requests_per_second
+        # Rate limiting - one token bucket per host: host -> (tokens, last_refill)
+        self._rate = config.requests_per_second
+        self._bucket_capacity = max(1.0, config.requests_per_second)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
         
         # User agent rotation
         self.user_agent_index = 0
@@ -70,90 +98,148 @@ class ScrapingEngine:
         if self.is_processing:
             raise RuntimeError("Scraping engine is already processing")
         
+        # Sync/async is decided once here, so progress flushes just await the callback
+        if progress_callback is not None and not asyncio.iscoroutinefunction(progress_callback):
+            sync_progress_callback = progress_callback
+            
+            async def progress_callback(processed: int, total: int, current_url: str):
+                sync_progress_callback(processed, total, current_url)
+        
         self.is_processing = True
         self.total_count = len(links)
         self.processed_count = 0
+        self._pending_successes = self._pending_failures = 0
+        self._last_progress_flush = time.monotonic()
         
         self.logger.info(f"Starting to process {len(links)} links")
         phase_names = ["Link Extraction", "Web Scraping", "Data Processing"]
         progress_tracker = AdvancedProgressTracker("Advanced Web Scraping", len(links), phase_names)
         progress_tracker.set_phase(1, f"Processing {len(links)} product URLs")
         
+        # Workers hand finished results to this writer instead of pickling to disk themselves
+        self._disk_write_queue = asyncio.Queue(maxsize=DISK_WRITE_QUEUE_SIZE)
+        disk_writer = asyncio.ensure_future(self._disk_writer_loop(self._disk_write_queue))
+        
         try:
-            # Create semaphore to limit concurrent requests
-            semaphore = asyncio.Semaphore(self.config.concurrent_requests)
+            # Shared across calls so DNS cache, TLS sessions and pooled connections survive
+            session = await self._get_session()
             
-            # Create aiohttp session with optimized configuration
-            import ssl
-            connector = aiohttp.TCPConnector(
-                limit=self.config.connection_pool_size,
-                limit_per_host=self.config.concurrent_requests,
-                ttl_dns_cache=self.config.dns_cache_ttl,
-                use_dns_cache=True,
-                enable_cleanup_closed=True,  # Enable connection cleanup
-                keepalive_timeout=60,  # Keep connections alive longer
-                ssl=False  # Disable SSL verification for internal tool
-            )
+            # Duplicate URLs are fetched once: positions are grouped by URL up front
+            positions: Dict[str, List[int]] = {}
+            for index, link in enumerate(links):
+                positions.setdefault(link.url, []).append(index)
             
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+            # A fixed pool of workers drains a queue of per-URL position lists, so only
+            # concurrent_requests coroutines are alive however many links there are
+            queue: asyncio.Queue = asyncio.Queue()
+            for indices in positions.values():
+                queue.put_nowait(indices)
             
-            # Configure headers with compression and user agent rotation
-            session_headers = self.config.default_headers.copy()
-            session_headers['User-Agent'] = self._get_next_user_agent()
-            if self.config.enable_compression and 'Accept-Encoding' in session_headers:
-                # Ensure compression is enabled
-                session_headers['Accept-Encoding'] = 'gzip, deflate, br'
+            scraping_results: List[Optional[ScrapingResult]] = [None] * len(links)
             
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers=session_headers
-            ) as session:
-                
-                # Create tasks for concurrent processing
-                tasks = [
-                    self._process_single_link(
-                        link, 
-                        session, 
-                        semaphore,
-                        progress_callback,
-                        result_callback,
-                        progress_tracker
-                    )
-                    for link in links
-                ]
-                
-                # Execute all tasks concurrently
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results and handle exceptions
-                scraping_results = []
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Task failed for {links[i].url}: {str(result)}")
-                        # Create failed result
-                        failed_result = ScrapingResult(
-                            url=links[i].url,
-                            status=ProcessingStatus.FAILED,
-                            error_message=str(result),
+            async def worker():
+                while True:
+                    try:
+                        indices = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    
+                    link = links[indices[0]]
+                    # Host and description are parsed once per URL
+                    link_info = self._describe_link(link.url)
+                    
+                    # Only the fetch is guarded here - callback errors are handled below
+                    try:
+                        result = await self._fetch_link(link, session, link_info)
+                    except Exception as e:
+                        self.logger.error(f"Task failed for {link.url}: {str(e)}")
+                        # Create failed result and stream it like any other
+                        result = ScrapingResult.for_failure(
+                            link.url,
+                            str(e),
                             attempts=self.config.retry_attempts
                         )
-                        scraping_results.append(failed_result)
-                    else:
-                        scraping_results.append(result)
-                
-                progress_tracker.complete(f"{len(scraping_results)} links processed")
-                self.logger.info(f"Completed processing {len(scraping_results)} links")
-                
-                return scraping_results
-                
+                    
+                    # Every position, the first included, shares the result and is reported once
+                    for index in indices:
+                        target = links[index]
+                        scraping_results[index] = result
+                        self._apply_result(target, result)
+                        try:
+                            await self._report_result(
+                                target, result, link_info[1], progress_callback, result_callback, progress_tracker
+                            )
+                        except Exception as callback_error:
+                            self.logger.warning(f"Result callback failed for {target.url}: {callback_error}")
+            
+            worker_count = max(1, min(self.config.concurrent_requests, len(positions)))
+            await asyncio.gather(*(worker() for _ in range(worker_count)))
+            
+            # Report whatever the last partial batch left behind
+            if links:
+                await self._flush_progress(progress_callback, progress_tracker, links[-1].url, None)
+            
+            progress_tracker.complete(f"{len(scraping_results)} links processed")
+            self.logger.info(f"Completed processing {len(scraping_results)} links")
+            
+            return scraping_results
+            
         except Exception as e:
             self.logger.error(f"Scraping engine failed: {str(e)}")
             raise
         
         finally:
+            await self._stop_disk_writer(disk_writer)
             self.is_processing = False
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the engine's HTTP session, creating it on first use in the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is loop:
+            return self._session
+        
+        # Create aiohttp session with optimized configuration
+        connector = aiohttp.TCPConnector(
+            limit=self.config.connection_pool_size,
+            limit_per_host=self.config.concurrent_requests,
+            ttl_dns_cache=self.config.dns_cache_ttl,
+            use_dns_cache=True,
+            enable_cleanup_closed=True,  # Enable connection cleanup
+            keepalive_timeout=60,  # Keep connections alive longer
+            ssl=False  # Disable SSL verification for internal tool
+        )
+        
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        
+        # Configure headers with compression; the User-Agent is rotated per request
+        session_headers = self.config.default_headers.copy()
+        if self.config.enable_compression:
+            # gzip first: brotli saves little on HTML and decoding it costs us more CPU
+            session_headers['Accept-Encoding'] = (
+                'gzip, deflate, br;q=0.5' if self.config.prefer_brotli else 'gzip, deflate'
+            )
+        
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=session_headers
+        )
+        self._session_loop = loop
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session and its connection pool."""
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    async def __aenter__(self) -> "ScrapingEngine":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     async def _process_single_link(
         self,
         link: ProductLink,
@@ -161,162 +247,321 @@ class ScrapingEngine:
         semaphore: asyncio.Semaphore,
         progress_callback: Optional[Callable[[int, int, str], None]],
         result_callback: Optional[Callable[[ScrapingResult], None]],
-        progress_tracker: AdvancedProgressTracker
+        progress_tracker: AdvancedProgressTracker,
+        link_info: Optional[Tuple[str, str]] = None
     ) -> ScrapingResult:
-        """Process a single product link."""
-        
+        """Process a single product link under a concurrency semaphore."""
         async with semaphore:  # Limit concurrent requests
-            start_time = time.time()
-            
-            # Rate limiting
-            await self._rate_limit()
-            
-            result = ScrapingResult(
-                url=link.url,
-                status=ProcessingStatus.IN_PROGRESS,
-                attempts=0
+            return await self._scrape_link(
+                link, session, progress_callback, result_callback, progress_tracker, link_info
             )
+    
+    async def _scrape_link(
+        self,
+        link: ProductLink,
+        session: aiohttp.ClientSession,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        result_callback: Optional[Callable[[ScrapingResult], None]],
+        progress_tracker: AdvancedProgressTracker,
+        link_info: Optional[Tuple[str, str]] = None
+    ) -> ScrapingResult:
+        """Scrape one product link and report it; link_info is the (host, description) from _describe_link."""
+        link_info = link_info or self._describe_link(link.url)
+        result = await self._fetch_link(link, session, link_info)
+        return await self._report_result(
+            link, result, link_info[1], progress_callback, result_callback, progress_tracker
+        )
+    
+    async def _fetch_link(
+        self,
+        link: ProductLink,
+        session: aiohttp.ClientSession,
+        link_info: Tuple[str, str]
+    ) -> ScrapingResult:
+        """Fetch one product link (cache first) without counting or reporting it."""
+        host = link_info[0]
+        
+        # The loop's monotonic clock - the same one asyncio.sleep deadlines use
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        result = ScrapingResult(
+            url=link.url,
+            status=ProcessingStatus.IN_PROGRESS,
+            attempts=0
+        )
+        
+        try:
+            self.logger.debug(f"Processing link: {link.url}")
             
-            try:
-                self.logger.debug(f"Processing link: {link.url}")
+            # Check caches first (memory cache -> disk cache -> actual scraping)
+            cached_result = await self._check_caches(link.url)
+            if cached_result:
+                self.cache_hits += 1
+                self.logger.debug(f"Cache hit for {link.url}")
                 
-                # Check caches first (memory cache -> disk cache -> actual scraping)
-                cached_result = self._check_caches(link.url)
-                if cached_result:
-                    self.cache_hits += 1
-                    self.logger.debug(f"Cache hit for {link.url}")
-                    
-                    # Update the link with cached data
-                    if cached_result.data:
-                        link.extracted_data = cached_result.data
-                        link.processed = True
-                    else:
-                        link.processing_error = cached_result.error_message
-                    
-                    return cached_result
-                
-                self.cache_misses += 1
-                
-                # Select appropriate scraping strategy
-                strategy = self.strategy_manager.select_strategy(link.url)
-                if not strategy:
-                    raise Exception("No suitable scraping strategy found")
-                
-                result.extraction_method = strategy.name
-                
-                # Attempt extraction with retries
-                extracted_data = None
-                last_error = None
-                
-                for attempt in range(self.config.retry_attempts):
-                    result.attempts = attempt + 1
-                    
-                    try:
-                        extracted_data = await strategy.extract_data(link.url, session)
-                        if extracted_data and extracted_data.is_valid():
-                            break
-                        else:
-                            last_error = "No valid data extracted"
-                            
-                    except Exception as e:
-                        last_error = str(e)
-                        self.logger.warning(f"Attempt {attempt + 1} failed for {link.url}: {str(e)}")
-                        
-                        if attempt < self.config.retry_attempts - 1:
-                            await asyncio.sleep(self.config.retry_delay * (attempt + 1))
-                
-                # Finalize result
-                if extracted_data and extracted_data.is_valid():
-                    result.status = ProcessingStatus.COMPLETED
-                    result.data = extracted_data
-                    link.extracted_data = extracted_data
-                    link.processed = True
-                else:
-                    result.status = ProcessingStatus.FAILED
-                    result.error_message = last_error or "Failed to extract valid data"
-                    link.processing_error = result.error_message
-                
-                # Cache the result (both successful and failed results)
-                self._cache_result(link.url, result)
-                
-            except Exception as e:
-                result.status = ProcessingStatus.FAILED
-                result.error_message = str(e)
-                link.processing_error = result.error_message
-                self.logger.error(f"Failed to process {link.url}: {str(e)}")
+                # Update the link with cached data
+                self._apply_result(link, cached_result)
+                return cached_result
             
-            # Calculate processing time
-            result.processing_time = time.time() - start_time
+            self.cache_misses += 1
             
-            # Update counters and progress tracking
-            self.processed_count += 1
-            success = (result.status == ProcessingStatus.COMPLETED)
+            # Rate limiting (per host) - only requests that go to the network spend a token
+            await self._rate_limit(host)
             
-            # Update progress callback with current count
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback(self.processed_count, self.total_count, link.url)
-                else:
-                    progress_callback(self.processed_count, self.total_count, link.url)
+            # Select appropriate scraping strategy
+            strategy = self.strategy_manager.select_strategy(link.url)
+            if not strategy:
+                raise Exception(ScrapingResult._ERROR_MSGS["no_strategy"])
             
-            # Extract domain for better tracking
-            try:
-                from urllib.parse import urlparse
-                domain = urlparse(link.url).netloc
-                item_description = f"{domain} - {link.url.split('/')[-1][:30]}"
-            except:
-                item_description = link.url[:50]
+            result.extraction_method = strategy.name
             
-            progress_tracker.update(
-                items_processed=1, 
-                success=success, 
-                current_item_description=item_description
+            # Attempt extraction with retries
+            extracted_data, last_error = await self._retry(
+                lambda: strategy.extract_data(link.url, session, self._request_headers()),
+                link.url,
+                result
             )
             
-            if result_callback:
-                result_callback(result)
+            # Finalize result
+            if extracted_data:
+                result.status = ProcessingStatus.COMPLETED
+                result.data = extracted_data
+                link.extracted_data = extracted_data
+                link.processed = True
+            else:
+                result.status = ProcessingStatus.FAILED
+                result.error_message = last_error or ScrapingResult._ERROR_MSGS["extract_failed"]
+                link.processing_error = result.error_message
+            
+            # Cache the result (both successful and failed results)
+            await self._cache_result(link.url, result)
             
-            return result
+        except Exception as e:
+            result.status = ProcessingStatus.FAILED
+            result.error_message = str(e)
+            link.processing_error = result.error_message
+            self.logger.error(f"Failed to process {link.url}: {str(e)}")
+        
+        # Calculate processing time
+        result.processing_time = loop.time() - start_time
+        
+        return result
     
-    async def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    async def _retry(
+        self,
+        attempt_factory: Callable[[], Awaitable[Optional[ProductData]]],
+        url: str,
+        result: ScrapingResult
+    ) -> Tuple[Optional[ProductData], Optional[str]]:
+        """
+        Run attempt_factory up to retry_attempts times, stopping at the first valid data.
         
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            await asyncio.sleep(sleep_time)
+        Failed attempts back off exponentially from retry_delay plus up to 100 ms of
+        jitter, so workers hitting the same struggling host don't retry in lockstep.
         
-        self.last_request_time = time.time()
+        Returns:
+            (valid data or None, error from the last failed attempt)
+        """
+        attempts = self.config.retry_attempts
+        last_error = None
+        
+        for attempt in range(attempts):
+            result.attempts = attempt + 1
+            
+            try:
+                data = await attempt_factory()
+                if data and data.is_valid():
+                    return data, None
+                last_error = ScrapingResult._ERROR_MSGS["no_data"]
+                
+            except Exception as e:
+                last_error = str(e)
+                self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {last_error}")
+                
+                if attempt < attempts - 1:
+                    await asyncio.sleep(self.config.retry_delay * (2 ** attempt) + random.random() * 0.1)
+        
+        return None, last_error
     
-    def _check_caches(self, url: str) -> Optional[ScrapingResult]:
-        """Check memory and disk caches for existing result."""
+    @staticmethod
+    def _apply_result(link: ProductLink, result: ScrapingResult):
+        """Copy a finished result's data or error onto the link."""
+        if result.data:
+            link.extracted_data = result.data
+            link.processed = True
+        else:
+            link.processing_error = result.error_message
+    
+    async def _report_result(
+        self,
+        link: ProductLink,
+        result: ScrapingResult,
+        item_description: str,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        result_callback: Optional[Callable[[ScrapingResult], None]],
+        progress_tracker: AdvancedProgressTracker
+    ) -> ScrapingResult:
+        """Count a finished link and hand its result to the callbacks as soon as it completes."""
+        # Update counters; progress is reported in batches
+        self.processed_count += 1
+        if result.status is ProcessingStatus.COMPLETED:
+            self._pending_successes += 1
+        else:
+            self._pending_failures += 1
+        
+        if self._progress_due():
+            await self._flush_progress(progress_callback, progress_tracker, link.url, item_description)
+        
+        if result_callback:
+            result_callback(result)
+        
+        return result
+    
+    def _progress_due(self) -> bool:
+        """Whether buffered completions should be reported now."""
+        remaining = self.total_count - self.processed_count
+        if remaining <= 0:
+            return True
+        
+        # Many tasks outstanding -> larger batches; near the end -> report every completion
+        batch_size = max(1, min(PROGRESS_BATCH_MAX, remaining // 32))
+        pending = self._pending_successes + self._pending_failures
+        return pending >= batch_size or time.monotonic() - self._last_progress_flush >= PROGRESS_FLUSH_INTERVAL
+    
+    async def _flush_progress(
+        self,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        progress_tracker: AdvancedProgressTracker,
+        current_url: str,
+        item_description: Optional[str]
+    ):
+        """Report buffered completions to the tracker and the (coroutine) progress callback in one go."""
+        successes, failures = self._pending_successes, self._pending_failures
+        if not successes and not failures:
+            return
+        
+        # Reset before awaiting so completions during the callback start a new batch
+        self._pending_successes = self._pending_failures = 0
+        self._last_progress_flush = time.monotonic()
+        
+        if successes:
+            progress_tracker.update(items_processed=successes, success=True, current_item_description=item_description)
+        if failures:
+            progress_tracker.update(items_processed=failures, success=False, current_item_description=item_description)
+        
+        # Update progress callback with current count
+        if progress_callback:
+            await progress_callback(self.processed_count, self.total_count, current_url)
+    
+    @staticmethod
+    def _describe_link(url: str) -> Tuple[str, str]:
+        """Return (host, progress description) for a URL, computed once before scraping starts."""
+        try:
+            host = urlsplit(url).netloc
+            return host, f"{host} - {url.rsplit('/', 1)[-1][:30]}"
+        except ValueError:
+            return "", url[:50]
+    
+    async def _rate_limit(self, host: str):
+        """Apply token-bucket rate limiting per host, so different hosts never wait on each other."""
+        # Read here, not passed in: a stale reading older than the bucket's last refill would drain it
+        now = asyncio.get_running_loop().time()
+        
+        # Refill and take a token in one step. There is no await in between, so this
+        # read-modify-write is atomic on the event loop without a lock.
+        tokens, last_refill = self._buckets.get(host, (self._bucket_capacity, now))
+        tokens = min(self._bucket_capacity, tokens + (now - last_refill) * self._rate) - 1.0
+        self._buckets[host] = (tokens, now)
+        
+        # A negative balance is a reservation: wait until our token has been refilled
+        if tokens < 0:
+            await asyncio.sleep(-tokens / self._rate)
+    
+    async def _check_caches(self, url: str) -> Optional[ScrapingResult]:
+        """Check memory and disk caches for existing result; the disk lookup runs on the executor."""
         # Check memory cache first (fastest)
         memory_result = self.memory_cache.get(url)
         if memory_result:
             return memory_result
         
-        # Check disk cache
-        disk_result = self.disk_cache.get_cached_result(url)
+        # A recent full miss stays a miss until this engine caches the URL
+        if url in self._recent_misses:
+            return None
+        
+        # Check disk cache (sqlite + pickle) off the event loop thread
+        loop = asyncio.get_running_loop()
+        disk_result = await loop.run_in_executor(None, self.disk_cache.get_cached_result, url)
         if disk_result:
             # Store in memory cache for faster future access
-            self.memory_cache.put(url, disk_result, ttl_seconds=300)  # 5 minutes in memory
+            self.memory_cache.put(url, disk_result)
             return disk_result
         
+        self._recent_misses[url] = None
+        if len(self._recent_misses) > RECENT_MISSES_MAX:
+            self._recent_misses.popitem(last=False)
+        
         return None
     
-    def _cache_result(self, url: str, result: ScrapingResult):
+    async def _cache_result(self, url: str, result: ScrapingResult):
         """Cache the scraping result in both memory and disk caches."""
+        self._recent_misses.pop(url, None)
+        
         try:
             # Cache in memory (short-term, fast access)
-            self.memory_cache.put(url, result, ttl_seconds=300)  # 5 minutes
+            self.memory_cache.put(url, result)
             
-            # Cache on disk (long-term, persistent)
-            self.disk_cache.cache_result(url, result)
+            # Cache on disk (long-term, persistent) - via the background writer when one is running
+            queue = self._disk_write_queue
+            if queue is not None:
+                try:
+                    queue.put_nowait((url, result))
+                    return
+                except asyncio.QueueFull:
+                    pass  # Writer is behind; persist here rather than drop the entry
+            
+            # No writer running (single URL tests) or a full queue - still off the loop thread
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.disk_cache.cache_result, url, result)
             
         except Exception as e:
             self.logger.warning(f"Failed to cache result for {url}: {e}")
     
+    async def _disk_writer_loop(self, queue: asyncio.Queue):
+        """Persist queued (url, result) pairs in batches on the executor; a None item ends the loop."""
+        loop = asyncio.get_running_loop()
+        done = False
+        
+        while not done:
+            batch = [await queue.get()]
+            while len(batch) < DISK_WRITE_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            items = [item for item in batch if item is not None]
+            done = len(items) != len(batch)
+            
+            if items:
+                try:
+                    await loop.run_in_executor(None, self._write_disk_batch, items)
+                except Exception as e:
+                    self.logger.warning(f"Failed to write {len(items)} results to the disk cache: {e}")
+    
+    def _write_disk_batch(self, items: List[Tuple[str, ScrapingResult]]):
+        """Write a batch of results to the disk cache (runs in a worker thread)."""
+        for url, result in items:
+            self.disk_cache.cache_result(url, result)
+    
+    async def _stop_disk_writer(self, writer: "asyncio.Future"):
+        """Let the writer flush everything queued so far, then detach it."""
+        queue, self._disk_write_queue = self._disk_write_queue, None
+        await queue.put(None)
+        await writer
+    
+    def _request_headers(self) -> Dict[str, str]:
+        """Per-request headers carrying the next User-Agent in the rotation."""
+        # No await between read and advance, so the rotation index needs no lock
+        return {'User-Agent': self._get_next_user_agent()}
+    
     def _get_next_user_agent(self) -> str:
         """Get the next user agent for rotation."""
         if not self.config.user_agents:
@@ -333,42 +578,23 @@ class ScrapingEngine:
         # Create a temporary link object
         test_link = ProductLink(url=url, row_index=0, sheet_name="test")
         
-        # Process with a temporary session using optimized configuration
-        connector = aiohttp.TCPConnector(
-            limit=1,
-            ttl_dns_cache=self.config.dns_cache_ttl,
-            use_dns_cache=True,
-            ssl=False
-        )
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        session = await self._get_session()
         
-        # Configure headers with compression and user agent rotation
-        session_headers = self.config.default_headers.copy()
-        session_headers['User-Agent'] = self._get_next_user_agent()
-        if self.config.enable_compression and 'Accept-Encoding' in session_headers:
-            session_headers['Accept-Encoding'] = 'gzip, deflate, br'
+        semaphore = asyncio.Semaphore(1)
+        progress_tracker = AdvancedProgressTracker("URL Test", 1, ["Testing"])
+        progress_tracker.set_phase(0, f"Testing URL: {url}")
         
-        async with aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout,
-            headers=session_headers
-        ) as session:
-            
-            semaphore = asyncio.Semaphore(1)
-            progress_tracker = AdvancedProgressTracker("URL Test", 1, ["Testing"])
-            progress_tracker.set_phase(0, f"Testing URL: {url}")
-            
-            result = await self._process_single_link(
-                test_link, 
-                session, 
-                semaphore,
-                None,  # No progress callback
-                None,  # No result callback
-                progress_tracker
-            )
-            
-            progress_tracker.complete("URL test completed")
-            return result
+        result = await self._process_single_link(
+            test_link, 
+            session, 
+            semaphore,
+            None,  # No progress callback
+            None,  # No result callback
+            progress_tracker
+        )
+        
+        progress_tracker.complete("URL test completed")
+        return result
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get scraping engine statistics including cache performance."""
@@ -394,13 +620,15 @@ class ScrapingEngine:
                 "requests_per_second": self.config.requests_per_second,
                 "connection_pool_size": self.config.connection_pool_size,
                 "dns_cache_ttl": self.config.dns_cache_ttl,
-                "enable_compression": self.config.enable_compression
+                "enable_compression": self.config.enable_compression,
+                "prefer_brotli": self.config.prefer_brotli
             }
         }
     
     def clear_cache(self, older_than_hours: Optional[int] = None):
         """Clear cache entries."""
         self.memory_cache.clear()
+        self._recent_misses.clear()
         removed_count = self.disk_cache.clear_cache(older_than_hours)
         self.logger.info(f"Cache cleared: {removed_count} entries removed")
         
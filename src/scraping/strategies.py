@@ -6,13 +6,24 @@ import aiohttp
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 from urllib.parse import urlparse, urljoin
-from datetime import datetime
 import json
 
 from bs4 import BeautifulSoup
 from models.product_data import ProductData
 from utils.logger import get_logger
 
+# Fallback browser identity when the engine doesn't supply a rotated User-Agent
+_DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Base headers for page fetches; per-request headers are layered on top.
+# Accept-Encoding is left to the session, which negotiates it from the config.
+_FETCH_HEADERS = {
+    'User-Agent': _DEFAULT_USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive',
+}
+
 
 class ScrapingStrategy(ABC):
     """Abstract base class for web scraping strategies."""
@@ -27,8 +38,13 @@ class ScrapingStrategy(ABC):
         pass
     
     @abstractmethod
-    async def extract_data(self, url: str, session: aiohttp.ClientSession) -> Optional[ProductData]:
-        """Extract product data from the given URL."""
+    async def extract_data(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[ProductData]:
+        """Extract product data from the given URL; headers are per-request overrides (e.g. User-Agent)."""
         pass
     
     @abstractmethod
@@ -272,57 +288,66 @@ class BeautifulSoupStrategy(ScrapingStrategy):
         except:
             return False
     
-    async def extract_data(self, url: str, session: aiohttp.ClientSession) -> Optional[ProductData]:
+    async def extract_data(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[ProductData]:
         """Extract data using BeautifulSoup."""
         self.logger.debug(f"Extracting data from {url}")
         
         try:
             # Fetch the webpage
-            html_content = await self._fetch_html(url, session)
+            html_content = await self._fetch_html(url, session, headers)
             if not html_content:
                 return None
             
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Extract product data using various strategies
-            product_data = ProductData(
-                source_url=url,
-                extracted_at=datetime.now(),
-                extraction_method="BeautifulSoup"
-            )
-            
-            # Try different extraction approaches
-            self._extract_from_tables(soup, product_data)
-            self._extract_from_lists(soup, product_data)
-            self._extract_from_text(soup, product_data)
-            self._extract_from_json_ld(soup, product_data)
-            self._extract_from_javascript(soup, product_data)
-            
-            # Set default package units if not found (most products are sold individually)
-            if not product_data.package_units:
-                product_data.package_units = 1
-                self.logger.debug("Set default package units to 1")
-            
-            # Calculate confidence based on extracted data
-            product_data.extraction_confidence = self._calculate_confidence(product_data)
-            
-            self.logger.debug(f"Extracted data with confidence {product_data.extraction_confidence:.2f}")
-            return product_data
+            # Parsing is CPU-bound; keep it off the event loop (the GUI's Tk thread)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._parse_product_data, url, html_content)
             
         except Exception as e:
             self.logger.error(f"Failed to extract data from {url}: {str(e)}")
             return None
     
-    async def _fetch_html(self, url: str, session: aiohttp.ClientSession) -> Optional[str]:
+    def _parse_product_data(self, url: str, html_content: str) -> ProductData:
+        """Parse fetched HTML into ProductData (runs in a worker thread)."""
+        # Parse with BeautifulSoup
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # Extract product data using various strategies
+        product_data = ProductData(
+            source_url=url,
+            extraction_method="BeautifulSoup"
+        )
+        
+        # Try different extraction approaches
+        self._extract_from_tables(soup, product_data)
+        self._extract_from_lists(soup, product_data)
+        self._extract_from_text(soup, product_data)
+        self._extract_from_json_ld(soup, product_data)
+        self._extract_from_javascript(soup, product_data)
+        
+        # Set default package units if not found (most products are sold individually)
+        if not product_data.package_units:
+            product_data.package_units = 1
+            self.logger.debug("Set default package units to 1")
+        
+        # Calculate confidence based on extracted data
+        product_data.extraction_confidence = self._calculate_confidence(product_data)
+        
+        self.logger.debug(f"Extracted data with confidence {product_data.extraction_confidence:.2f}")
+        return product_data
+    
+    async def _fetch_html(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> Optional[str]:
         """Fetch HTML content from URL."""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
+        headers = {**_FETCH_HEADERS, **extra_headers} if extra_headers else _FETCH_HEADERS
         
         for attempt in range(self.max_retries):
             try:
@@ -519,7 +544,6 @@ class BeautifulSoupStrategy(ScrapingStrategy):
             ]
             
             for pattern in patterns:
-                import re
                 matches = re.findall(pattern, script_content, re.IGNORECASE)
                 if matches and not product_data.package_units:
                     try:
@@ -637,7 +661,12 @@ class PlaywrightStrategy(ScrapingStrategy):
         except:
             return False
     
-    async def extract_data(self, url: str, session: aiohttp.ClientSession) -> Optional[ProductData]:
+    async def extract_data(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[ProductData]:
         """Extract data using Playwright."""
         try:
             # Import playwright here to avoid dependency issues if not installed
@@ -649,7 +678,7 @@ class PlaywrightStrategy(ScrapingStrategy):
                 
                 # Set user agent
                 await page.set_extra_http_headers({
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                    'User-Agent': (headers or {}).get('User-Agent', _DEFAULT_USER_AGENT)
                 })
                 
                 # Navigate to page and wait for load
@@ -660,23 +689,9 @@ class PlaywrightStrategy(ScrapingStrategy):
                 content = await page.content()
                 await browser.close()
                 
-                # Use BeautifulSoup to parse the rendered content
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Create product data
-                product_data = ProductData(
-                    source_url=url,
-                    extracted_at=datetime.now(),
-                    extraction_method="Playwright"
-                )
-                
-                # Use similar extraction logic as BeautifulSoup
-                self._extract_data_from_soup(soup, product_data)
-                
-                # Calculate confidence
-                product_data.extraction_confidence = self._calculate_confidence(product_data)
-                
-                return product_data
+                # Parse the rendered content off the event loop
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, self._parse_rendered_content, url, content)
                 
         except ImportError:
             self.logger.error("Playwright not installed. Install with: pip install playwright")
@@ -685,6 +700,25 @@ class PlaywrightStrategy(ScrapingStrategy):
             self.logger.error(f"Playwright extraction failed for {url}: {str(e)}")
             return None
     
+    def _parse_rendered_content(self, url: str, content: str) -> ProductData:
+        """Parse rendered HTML into ProductData (runs in a worker thread)."""
+        # Use BeautifulSoup to parse the rendered content
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Create product data
+        product_data = ProductData(
+            source_url=url,
+            extraction_method="Playwright"
+        )
+        
+        # Use similar extraction logic as BeautifulSoup
+        self._extract_data_from_soup(soup, product_data)
+        
+        # Calculate confidence
+        product_data.extraction_confidence = self._calculate_confidence(product_data)
+        
+        return product_data
+    
     def _extract_data_from_soup(self, soup: BeautifulSoup, product_data: ProductData):
         """Extract data from parsed HTML (similar to BeautifulSoup strategy)."""
         # Reuse BeautifulSoup extraction logic
@@ -717,7 +751,12 @@ class AzureAIStrategy(ScrapingStrategy):
         """Azure AI can handle any URL if credentials are configured."""
         return bool(self.endpoint and self.api_key)
     
-    async def extract_data(self, url: str, session: aiohttp.ClientSession) -> Optional[ProductData]:
+    async def extract_data(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[ProductData]:
         """Extract data using Azure AI Form Recognizer."""
         try:
             from azure.ai.formrecognizer import DocumentAnalysisClient
@@ -738,7 +777,6 @@ class AzureAIStrategy(ScrapingStrategy):
             # Extract data from Azure AI results
             product_data = ProductData(
                 source_url=url,
-                extracted_at=datetime.now(),
                 extraction_method="Azure AI"
             )
             
@@ -5,10 +5,13 @@ import json
 import pickle
 import hashlib
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Deque
 from pathlib import Path
 import sqlite3
 import threading
+import time
+import warnings
+from collections import OrderedDict, deque
 from dataclasses import asdict
 
 from models.product_data import ProductData
@@ -309,68 +312,105 @@ class CacheManager:
 
 
 class MemoryCache:
-    """In-memory cache for frequently accessed data with LRU eviction."""
+    """
+    In-memory cache with LRU eviction and bucketed expiry.
     
-    def __init__(self, max_size: int = 1000):
+    Entries are grouped into time buckets of ttl_seconds / bucket_count; a whole
+    bucket is dropped once it is older than the TTL, so expiry costs one check per
+    bucket instead of a timestamp per entry. An entry therefore lives between
+    ttl_seconds - ttl_seconds / bucket_count and ttl_seconds.
+    """
+    
+    def __init__(self, max_size: int = 1000, ttl_seconds: int = 300, bucket_count: int = 5):
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if bucket_count < 1:
+            raise ValueError(f"bucket_count must be at least 1, got {bucket_count}")
+        
         self.max_size = max_size
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.access_order: List[str] = []
+        self.ttl_seconds = ttl_seconds
+        self.bucket_count = bucket_count
+        self._bucket_seconds = ttl_seconds / bucket_count
+        
+        # (time slice, key -> data) pairs, oldest bucket first; each bucket is in LRU order
+        self._buckets: "Deque[Tuple[int, OrderedDict[str, Any]]]" = deque()
+        self._size = 0
         self.lock = threading.RLock()
         self.logger = get_logger(f"{__name__}.memory")
     
+    def _current_bucket(self) -> "OrderedDict[str, Any]":
+        """Drop buckets that have aged out and return the bucket new entries go into."""
+        current_slice = int(time.monotonic() // self._bucket_seconds)
+        
+        buckets = self._buckets
+        while buckets and buckets[0][0] <= current_slice - self.bucket_count:
+            self._size -= len(buckets.popleft()[1])
+        
+        if not buckets or buckets[-1][0] != current_slice:
+            buckets.append((current_slice, OrderedDict()))
+        return buckets[-1][1]
+    
     def get(self, key: str) -> Optional[Any]:
         """Get item from memory cache."""
         with self.lock:
-            if key in self.cache:
-                # Move to end (most recently used)
-                self.access_order.remove(key)
-                self.access_order.append(key)
-                
-                entry = self.cache[key]
-                
-                # Check if expired
-                if entry['expires_at'] > datetime.now():
-                    return entry['data']
-                else:
-                    # Remove expired entry
-                    del self.cache[key]
-                    self.access_order.remove(key)
+            self._current_bucket()
+            
+            # Newest bucket first - recently stored keys are the likeliest hits
+            for _, bucket in reversed(self._buckets):
+                if key in bucket:
+                    # Move to end (most recently used) within its bucket - O(1) on an OrderedDict
+                    bucket.move_to_end(key)
+                    return bucket[key]
             
             return None
     
-    def put(self, key: str, data: Any, ttl_seconds: int = 300):
-        """Store item in memory cache with TTL."""
+    def put(self, key: str, data: Any, ttl_seconds: Optional[int] = None):
+        """
+        Store item in memory cache; it expires with its bucket.
+        
+        ttl_seconds is deprecated and ignored - the TTL is set per cache in __init__.
+        """
+        if ttl_seconds is not None:
+            warnings.warn(
+                "MemoryCache.put(ttl_seconds=...) is ignored; pass ttl_seconds to MemoryCache() instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        
         with self.lock:
-            expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
+            newest = self._current_bucket()
             
             # Remove existing entry if present
-            if key in self.cache:
-                self.access_order.remove(key)
+            for _, bucket in self._buckets:
+                if key in bucket:
+                    del bucket[key]
+                    self._size -= 1
+                    break
             
-            # Add new entry
-            self.cache[key] = {
-                'data': data,
-                'expires_at': expires_at,
-                'cached_at': datetime.now()
-            }
-            self.access_order.append(key)
+            newest[key] = data
+            self._size += 1
             
-            # Evict least recently used items if cache is full
-            while len(self.cache) > self.max_size:
-                lru_key = self.access_order.pop(0)
-                del self.cache[lru_key]
+            # Evict least recently used items of the oldest bucket if cache is full
+            while self._size > self.max_size:
+                oldest = self._buckets[0][1]
+                if oldest:
+                    oldest.popitem(last=False)
+                    self._size -= 1
+                else:
+                    self._buckets.popleft()
     
     def clear(self):
         """Clear all items from memory cache."""
         with self.lock:
-            self.cache.clear()
-            self.access_order.clear()
+            self._buckets.clear()
+            self._size = 0
     
     def get_stats(self) -> Dict[str, Any]:
         """Get memory cache statistics."""
         with self.lock:
             return {
-                "size": len(self.cache),
+                "size": self._size,
                 "max_size": self.max_size,
-                "utilization": (len(self.cache) / self.max_size) * 100 if self.max_size > 0 else 0
+                "ttl_seconds": self.ttl_seconds,
+                "utilization": (self._size / self.max_size) * 100 if self.max_size > 0 else 0
             }
\ No newline at end of file
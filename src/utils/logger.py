@@ -301,9 +301,11 @@ class AdvancedProgressTracker:
         
         # Determine if we should log
         time_since_last_log = (current_time - self.last_log_time).total_seconds()
+        log_step = max(1, self.total_items // 20)
         should_log = (
             time_since_last_log >= 15 or  # Every 15 seconds
-            self.processed_items % max(1, self.total_items // 20) == 0 or  # Every 5%
+            # Every 5% - compared by bucket so batched updates can't step over a boundary
+            self.processed_items // log_step != (self.processed_items - items_processed) // log_step or
             self.processed_items == self.total_items  # Completion
         )
         
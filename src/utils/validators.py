@@ -85,7 +85,6 @@ def validate_url(url: str) -> Tuple[bool, Optional[str]]:
     if url.startswith('=HYPERLINK'):
         # Extract URL from Excel HYPERLINK formula
         # Example: =HYPERLINK(_xlfn.CONCAT("https://new.abb.com/products/",C2),C2)
-        import re
         match = re.search(r'"(https?://[^"]+)"', url)
         if match:
             base_url = match.group(1)
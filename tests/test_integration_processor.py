@@ -0,0 +1,61 @@
+"""Tests for IntegrationProcessor's progress-callback helpers."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("aiohttp")
+
+from processing.integration_processor import IntegrationProcessor, _as_async_callback
+
+
+def test_none_stays_none():
+    assert _as_async_callback(None) is None
+
+
+def test_coroutine_function_is_returned_unchanged():
+    async def callback(*args):
+        pass
+    
+    assert _as_async_callback(callback) is callback
+
+
+@pytest.mark.asyncio
+async def test_sync_callback_is_wrapped_and_receives_all_arguments():
+    calls = []
+    
+    def callback(*args):
+        calls.append(args)
+    
+    wrapped = _as_async_callback(callback)
+    
+    assert wrapped is not callback
+    await wrapped("Reading", 0.1, 1, 2)
+    assert calls == [("Reading", 0.1, 1, 2)]
+
+
+@pytest.mark.asyncio
+async def test_sync_callback_errors_propagate():
+    def callback(*args):
+        raise ValueError("bad callback")
+    
+    with pytest.raises(ValueError):
+        await _as_async_callback(callback)()
+
+
+@pytest.mark.asyncio
+async def test_file_progress_callback_binds_the_file_position():
+    calls = []
+    
+    async def report(message, progress, current_file, total_files):
+        calls.append((message, progress, current_file, total_files))
+    
+    single_file = IntegrationProcessor._file_progress_callback(report, 2, 3)
+    await single_file("Scraping", 0.5, 1, 1)
+    
+    assert calls == [("Scraping", 0.5, 2, 3)]
+    assert IntegrationProcessor._file_progress_callback(None, 2, 3) is None
@@ -0,0 +1,113 @@
+"""Tests for MemoryCache's time-bucketed expiry and LRU eviction."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils import cache_manager
+from utils.cache_manager import MemoryCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive MemoryCache's monotonic clock by hand; advance with clock[0] += seconds."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_manager.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_survives_within_ttl(clock):
+    cache = MemoryCache(max_size=10, ttl_seconds=10, bucket_count=5)
+    cache.put("a", 1)
+    
+    # Bucket width is 2 s; an entry lives at least ttl - width
+    clock[0] += 7.9
+    assert cache.get("a") == 1
+
+
+def test_entry_expires_with_its_bucket(clock):
+    cache = MemoryCache(max_size=10, ttl_seconds=10, bucket_count=5)
+    cache.put("a", 1)
+    
+    clock[0] += 10
+    assert cache.get("a") is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_buckets_expire_independently(clock):
+    cache = MemoryCache(max_size=10, ttl_seconds=10, bucket_count=5)
+    cache.put("old", 1)
+    clock[0] += 6
+    cache.put("new", 2)
+    
+    clock[0] += 5
+    assert cache.get("old") is None
+    assert cache.get("new") == 2
+    assert cache.get_stats()["size"] == 1
+
+
+def test_put_replaces_key_from_an_older_bucket(clock):
+    cache = MemoryCache(max_size=10, ttl_seconds=10, bucket_count=5)
+    cache.put("a", 1)
+    clock[0] += 6
+    cache.put("a", 2)
+    
+    # The re-put moves the key to the newest bucket, so it outlives the first put
+    clock[0] += 5
+    assert cache.get("a") == 2
+    assert cache.get_stats()["size"] == 1
+
+
+def test_stored_none_is_counted(clock):
+    cache = MemoryCache(max_size=10, ttl_seconds=10)
+    cache.put("a", None)
+    cache.put("a", None)
+    assert cache.get_stats()["size"] == 1
+
+
+def test_evicts_least_recently_used_when_full(clock):
+    cache = MemoryCache(max_size=2, ttl_seconds=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_eviction_skips_emptied_buckets(clock):
+    cache = MemoryCache(max_size=2, ttl_seconds=10, bucket_count=5)
+    cache.put("a", 1)
+    clock[0] += 2
+    cache.put("b", 2)
+    cache.put("a", 3)  # Leaves the oldest bucket empty
+    clock[0] += 2
+    cache.put("c", 4)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 3
+    assert cache.get("c") == 4
+
+
+@pytest.mark.parametrize("ttl_seconds", [0, -5])
+def test_rejects_non_positive_ttl(ttl_seconds):
+    with pytest.raises(ValueError):
+        MemoryCache(ttl_seconds=ttl_seconds)
+
+
+def test_rejects_zero_buckets():
+    with pytest.raises(ValueError):
+        MemoryCache(bucket_count=0)
+
+
+def test_put_ttl_seconds_is_deprecated_but_accepted(clock):
+    cache = MemoryCache(max_size=10, ttl_seconds=10)
+    with pytest.warns(DeprecationWarning):
+        cache.put("a", 1, ttl_seconds=60)
+    assert cache.get("a") == 1
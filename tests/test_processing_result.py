@@ -0,0 +1,65 @@
+"""Tests for ScrapingResult's pooled failure messages and string interning."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.processing_result import ProcessingStatus, ScrapingResult
+from models.product_data import ProductData, ProductLink
+
+
+def test_known_kind_uses_the_pooled_message():
+    first = ScrapingResult.for_failure("https://a.com/1", "timeout")
+    second = ScrapingResult.for_failure("https://a.com/2", "timeout", attempts=3)
+    
+    assert first.status is ProcessingStatus.FAILED
+    assert first.error_message == "Request timed out"
+    assert first.error_message is second.error_message
+    assert (first.attempts, second.attempts) == (1, 3)
+
+
+def test_free_form_message_is_kept():
+    result = ScrapingResult.for_failure("https://a.com/1", "Connection reset by peer")
+    
+    assert result.error_message == "Connection reset by peer"
+    assert result.url == "https://a.com/1"
+    assert result.data is None
+
+
+def test_short_free_form_messages_are_shared():
+    first = ScrapingResult.for_failure("https://a.com/1", "".join(["HTTP ", "503"]))
+    second = ScrapingResult.for_failure("https://a.com/2", "".join(["HTTP ", "503"]))
+    
+    assert first.error_message is second.error_message
+
+
+def test_long_free_form_messages_are_not_interned():
+    message = "x" * 500
+    
+    assert ScrapingResult.for_failure("https://a.com/1", message).error_message is message
+
+
+@pytest.mark.parametrize("extraction_method", [None, 42])
+def test_non_str_extraction_method_is_left_alone(extraction_method):
+    result = ScrapingResult(url="https://a.com/1", status=ProcessingStatus.COMPLETED, extraction_method=extraction_method)
+    
+    assert result.extraction_method == extraction_method
+    assert ProductData(extraction_method=extraction_method).extraction_method == extraction_method
+
+
+def test_non_str_sheet_and_column_names_are_left_alone():
+    link = ProductLink(url="https://a.com/1", row_index=0, sheet_name=None, column_name=7)
+    
+    assert link.sheet_name is None
+    assert link.column_name == 7
+
+
+def test_str_names_are_interned():
+    first = ProductLink(url="https://a.com/1", row_index=0, sheet_name="".join(["She", "et1"]))
+    second = ProductLink(url="https://a.com/2", row_index=1, sheet_name="".join(["She", "et1"]))
+    
+    assert first.sheet_name is second.sheet_name
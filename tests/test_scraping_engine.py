@@ -0,0 +1,236 @@
+"""Tests for ScrapingEngine's duplicate-URL fan-out, result counting and rate limiting."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("aiohttp")
+
+from models.config_models import ScrapingConfig
+from models.processing_result import ProcessingStatus, ScrapingResult
+from models.product_data import ProductData, ProductLink
+from scraping.scraping_engine import ScrapingEngine
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Engine whose disk cache lives in a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return ScrapingEngine(ScrapingConfig(concurrent_requests=3, retry_attempts=2))
+
+
+def make_links(*urls):
+    return [ProductLink(url=url, row_index=i, sheet_name="test") for i, url in enumerate(urls)]
+
+
+def fake_fetch(fetched, fail_urls=()):
+    """A _fetch_link replacement recording each fetched URL."""
+    async def fetch(link, session, link_info):
+        fetched.append(link.url)
+        if link.url in fail_urls:
+            raise RuntimeError("boom")
+        data = ProductData(source_url=link.url, extraction_method="test")
+        link.extracted_data = data
+        link.processed = True
+        return ScrapingResult(url=link.url, status=ProcessingStatus.COMPLETED, data=data, attempts=1)
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_duplicate_urls_are_fetched_once(engine, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(engine, "_fetch_link", fake_fetch(fetched))
+    links = make_links("https://a.com/1", "https://b.com/2", "https://a.com/1", "https://a.com/1", "https://c.com/3")
+    
+    async with engine:
+        results = await engine.process_links(links)
+    
+    assert sorted(fetched) == ["https://a.com/1", "https://b.com/2", "https://c.com/3"]
+    assert results[0] is results[2] is results[3]
+    assert [result.url for result in results] == [link.url for link in links]
+    assert all(link.processed and link.extracted_data is not None for link in links)
+
+
+@pytest.mark.asyncio
+async def test_every_position_is_reported_once(engine, monkeypatch):
+    monkeypatch.setattr(engine, "_fetch_link", fake_fetch([]))
+    links = make_links("https://a.com/1", "https://a.com/1", "https://b.com/2")
+    reported = []
+    progress = []
+    
+    async with engine:
+        await engine.process_links(
+            links,
+            progress_callback=lambda processed, total, url: progress.append((processed, total)),
+            result_callback=reported.append
+        )
+    
+    assert len(reported) == len(links)
+    assert engine.processed_count == len(links)
+    assert progress[-1] == (len(links), len(links))
+
+
+@pytest.mark.asyncio
+async def test_failing_result_callback_does_not_fail_or_recount_the_fetch(engine, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(engine, "_fetch_link", fake_fetch(fetched))
+    links = make_links("https://a.com/1", "https://a.com/1", "https://a.com/1")
+    calls = []
+    
+    def result_callback(result):
+        calls.append(result)
+        if len(calls) == 1:
+            raise ValueError("callback bug")
+    
+    async with engine:
+        results = await engine.process_links(links, result_callback=result_callback)
+    
+    assert fetched == ["https://a.com/1"]
+    assert len(calls) == len(links)
+    assert engine.processed_count == len(links)
+    assert all(result.status is ProcessingStatus.COMPLETED for result in results)
+
+
+@pytest.mark.asyncio
+async def test_fetch_failure_is_shared_by_all_positions(engine, monkeypatch):
+    monkeypatch.setattr(engine, "_fetch_link", fake_fetch([], fail_urls={"https://a.com/1"}))
+    links = make_links("https://a.com/1", "https://b.com/2", "https://a.com/1")
+    reported = []
+    
+    async with engine:
+        results = await engine.process_links(links, result_callback=reported.append)
+    
+    assert results[0] is results[2]
+    assert results[0].status is ProcessingStatus.FAILED
+    assert results[0].error_message == "boom"
+    assert results[0].attempts == engine.config.retry_attempts
+    assert links[0].processing_error == links[2].processing_error == "boom"
+    assert results[1].status is ProcessingStatus.COMPLETED
+    assert len(reported) == len(links)
+    assert engine.processed_count == len(links)
+
+
+@pytest_asyncio.fixture
+async def paused_clock(monkeypatch):
+    """Freeze the loop clock and record asyncio.sleep delays instead of sleeping."""
+    loop = asyncio.get_running_loop()
+    now = [100.0]
+    sleeps = []
+    
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+    
+    monkeypatch.setattr(loop, "time", lambda: now[0])
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return now, sleeps
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_allows_a_burst_up_to_capacity(engine, paused_clock):
+    now, sleeps = paused_clock
+    
+    # requests_per_second=2.0 -> two tokens, refilled at 2 per second
+    await engine._rate_limit("a.com")
+    await engine._rate_limit("a.com")
+    assert sleeps == []
+    
+    # Further requests reserve future tokens and wait in turn
+    await engine._rate_limit("a.com")
+    await engine._rate_limit("a.com")
+    assert sleeps == pytest.approx([0.5, 1.0])
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_refills_over_time(engine, paused_clock):
+    now, sleeps = paused_clock
+    for _ in range(2):
+        await engine._rate_limit("a.com")
+    
+    now[0] += 0.5
+    await engine._rate_limit("a.com")
+    assert sleeps == []
+    
+    # The bucket never holds more than its capacity, however long it idles
+    now[0] += 60
+    for _ in range(3):
+        await engine._rate_limit("a.com")
+    assert sleeps == pytest.approx([0.5])
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_is_per_host(engine, paused_clock):
+    now, sleeps = paused_clock
+    for _ in range(2):
+        await engine._rate_limit("a.com")
+    
+    await engine._rate_limit("b.com")
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_do_not_spend_tokens(engine, paused_clock):
+    now, sleeps = paused_clock
+    link = make_links("https://a.com/1")[0]
+    cached = ScrapingResult(
+        url=link.url,
+        status=ProcessingStatus.COMPLETED,
+        data=ProductData(source_url=link.url, extraction_method="test")
+    )
+    engine.memory_cache.put(link.url, cached)
+    
+    result = await engine._fetch_link(link, None, engine._describe_link(link.url))
+    
+    assert result is cached
+    assert engine.cache_hits == 1
+    assert engine._buckets == {}
+    assert link.extracted_data is cached.data
+
+
+@pytest.mark.asyncio
+async def test_retry_backs_off_exponentially_with_bounded_jitter(tmp_path, monkeypatch, paused_clock):
+    now, sleeps = paused_clock
+    monkeypatch.chdir(tmp_path)
+    engine = ScrapingEngine(ScrapingConfig(retry_attempts=4, retry_delay=0.5))
+    result = ScrapingResult(url="https://a.com/1", status=ProcessingStatus.IN_PROGRESS)
+    
+    async def attempt():
+        raise ConnectionError("reset")
+    
+    data, last_error = await engine._retry(attempt, result.url, result)
+    
+    assert data is None
+    assert last_error == "reset"
+    assert result.attempts == 4
+    
+    # No sleep after the final attempt; each delay is base * 2**n plus < 100 ms of jitter
+    assert len(sleeps) == 3
+    for n, delay in enumerate(sleeps):
+        base = 0.5 * 2 ** n
+        assert base <= delay < base + 0.1
+
+
+@pytest.mark.asyncio
+async def test_retry_stops_at_the_first_valid_data(engine, paused_clock):
+    now, sleeps = paused_clock
+    result = ScrapingResult(url="https://a.com/1", status=ProcessingStatus.IN_PROGRESS)
+    valid = ProductData(ean="1234567890123", source_url=result.url)
+    outcomes = [ConnectionError("reset"), valid]
+    
+    async def attempt():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    data, last_error = await engine._retry(attempt, result.url, result)
+    
+    assert data is valid
+    assert last_error is None
+    assert result.attempts == 2
+    assert len(sleeps) == 1